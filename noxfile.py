@@ -111,6 +111,39 @@ def flop_counts(session):
     session.run("python", compute_counts, env=env)
 
 
+@nox.session(py=False)
+def benchmark(session):
+    env = {"PYTHONPATH": get_path("src")}
+    script = get_path("scripts", "benchmark.py")
+    session.run("python", script, *session.posargs, env=env)
+
+
+@nox.session(py=False)
+def flop_rates(session):
+    if py.path.local.sysfind("gcc") is None:
+        session.skip("`gcc` must be installed")
+    if py.path.local.sysfind("g++") is None:
+        session.skip("`g++` must be installed")
+
+    env = {"PYTHONPATH": get_path("src")}
+    script = get_path("scripts", "flop_rates.py")
+    session.run("python", script, env=env)
+
+
+@nox.session(py=False)
+def benchmark_fma(session):
+    env = {"PYTHONPATH": get_path("src")}
+    script = get_path("scripts", "benchmark_fma.py")
+    session.run("python", script, env=env)
+
+
+@nox.session(py=False)
+def benchmark_multi_float(session):
+    env = {"PYTHONPATH": get_path("src")}
+    script = get_path("scripts", "benchmark_multi_float.py")
+    session.run("python", script, env=env)
+
+
 @nox.session(py=False)
 def verify_table(session):
     env = {"PYTHONPATH": get_path("src")}
@@ -118,6 +151,20 @@ def verify_table(session):
     session.run("python", script, env=env)
 
 
+@nox.session(py=False)
+def verify_roots(session):
+    env = {"PYTHONPATH": get_path("src")}
+    script = get_path("scripts", "verify_roots.py")
+    session.run("python", script, env=env)
+
+
+@nox.session(py=False)
+def verify_unrolled(session):
+    env = {"PYTHONPATH": get_path("src")}
+    script = get_path("scripts", "verify_unrolled.py")
+    session.run("python", script, env=env)
+
+
 @nox.session(py=DEFAULT_INTERPRETER)
 def make_images(session):
     # Install all dependencies.
@@ -221,6 +268,7 @@ def verify_c(session):
         "-std=c99",
         "-O3",
         "-march=native",
+        "-fopenmp",
         "-o",
         "main",
         os.path.join("scripts", "tests.c"),
@@ -233,3 +281,10 @@ def verify_c(session):
     main_exe = os.path.join(".", "main")
     session.run(os.system, main_exe)
     session.run(os.remove, main_exe)
+
+
+@nox.session(py=False)
+def verify_c_de_casteljau(session):
+    env = {"PYTHONPATH": get_path("src")}
+    script = get_path("scripts", "verify_c_de_casteljau.py")
+    session.run("python", script, env=env)
@@ -0,0 +1,296 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Time the (scalar) evaluators over a grid of degrees, ``K`` and batches.
+
+For each ``(degree, K, batch size)`` a batch of points is evaluated in a
+loop (the same polynomial at every point) and the best time per
+evaluation is reported. An evaluator with a fixed ``K`` (e.g.
+``de_casteljau.compensated3``) is only timed when that ``K`` is in the
+grid and the "standard" algorithms are recorded with ``K = 1``.
+
+The results (along with metadata describing the machine) are written as
+JSON. If a baseline (i.e. the JSON output of an earlier run) is
+provided, every matching entry is compared against it and slowdowns
+beyond a threshold are reported (and cause a non-zero exit status).
+"""
+
+from __future__ import print_function
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import timeit
+
+import de_casteljau
+import eft
+import horner
+import vs_method
+
+
+DEGREES = (2, 4, 8, 16)
+K_VALUES = (2, 3, 4, 5)
+BATCH_SIZES = (1, 16, 256)
+# NOTE: Each timing repeat performs (roughly) this many evaluations.
+NUM_EVALS = 500
+NUM_REPEAT = 5
+DEFAULT_THRESHOLD = 0.25
+SEED = 2718
+# NOTE: The default output is outside the repository (so running the
+#       benchmark doesn't leave an untracked file behind).
+DEFAULT_OUTPUT = os.path.join(tempfile.gettempdir(), "benchmark.json")
+
+
+def _horner_compensated_k(K):
+    def func(s, coeffs):
+        return horner.compensated_k(s, coeffs, K)
+
+    return func
+
+
+def _sum_k(K):
+    # NOTE: The "point" is ignored; this sums ``degree + 1`` terms.
+    def func(s, coeffs):
+        return eft.sum_k(coeffs, K)
+
+    return func
+
+
+def evaluators(K_values):
+    """Get the evaluators to be timed.
+
+    Args:
+        K_values (Sequence[int]): The values of ``K`` in the grid.
+
+    Returns:
+        List[Tuple[str, int, Callable[[float, Sequence[float]], float]]]:
+        Triples of name, ``K`` and function.
+    """
+    fixed = (
+        ("de_casteljau.basic", 1, de_casteljau.basic),
+        ("de_casteljau.compensated", 2, de_casteljau.compensated),
+        ("de_casteljau.compensated3", 3, de_casteljau.compensated3),
+        ("de_casteljau.compensated4", 4, de_casteljau.compensated4),
+        ("de_casteljau.compensated5", 5, de_casteljau.compensated5),
+        ("horner.basic", 1, horner.basic),
+        ("horner.compensated", 2, horner.compensated),
+        ("horner.compensated3", 3, horner.compensated3),
+        ("vs_method.basic", 1, vs_method.basic),
+        ("vs_method.compensated", 2, vs_method.compensated),
+    )
+    result = [
+        (name, K, func) for name, K, func in fixed if K == 1 or K in K_values
+    ]
+    for K in K_values:
+        result.append(("horner.compensated_k", K, _horner_compensated_k(K)))
+    for K in K_values:
+        result.append(("eft.sum_k", K, _sum_k(K)))
+
+    return result
+
+
+def _git_commit():
+    try:
+        output = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return output.decode("ascii").strip()
+
+
+def machine_metadata():
+    """Describe the machine (and Python) the benchmark runs on."""
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python_implementation": platform.python_implementation(),
+        "python_version": platform.python_version(),
+        "fma_backend": eft.get_fma_backend(),
+        "git_commit": _git_commit(),
+    }
+
+
+def _run_batch(func, s_vals, coeffs):
+    for s in s_vals:
+        func(s, coeffs)
+
+
+def time_evaluator(func, s_vals, coeffs):
+    """Time an evaluator on a batch of points.
+
+    Returns:
+        float: The best time (over ``NUM_REPEAT`` repeats) per evaluation,
+        in nanoseconds.
+    """
+    number = max(1, NUM_EVALS // len(s_vals))
+    timer = timeit.Timer(lambda: _run_batch(func, s_vals, coeffs))
+    total = min(timer.repeat(repeat=NUM_REPEAT, number=number))
+    return 1e9 * total / (number * len(s_vals))
+
+
+def run_grid(degrees, K_values, batch_sizes):
+    """Time every evaluator over the full grid.
+
+    Returns:
+        List[dict]: One entry per ``(function, K, degree, batch_size)``.
+    """
+    results = []
+    for degree in degrees:
+        for batch_size in batch_sizes:
+            # NOTE: The inputs only depend on ``(degree, batch_size)`` (not
+            #       the rest of the grid) so runs can be compared.
+            seed = "{}-{}-{}".format(SEED, degree, batch_size)
+            rand_gen = random.Random(seed)
+            coeffs = tuple(
+                rand_gen.uniform(-1.0, 1.0) for _ in range(degree + 1)
+            )
+            s_vals = [rand_gen.random() for _ in range(batch_size)]
+            for name, K, func in evaluators(K_values):
+                ns_per_eval = time_evaluator(func, s_vals, coeffs)
+                results.append(
+                    {
+                        "function": name,
+                        "K": K,
+                        "degree": degree,
+                        "batch_size": batch_size,
+                        "ns_per_eval": ns_per_eval,
+                    }
+                )
+                print(
+                    "{:>26} K={} degree={:2d} batch={:4d}: {:10.1f} ns".format(
+                        name, K, degree, batch_size, ns_per_eval
+                    )
+                )
+
+    return results
+
+
+def _key(entry):
+    return entry["function"], entry["K"], entry["degree"], entry["batch_size"]
+
+
+def compare(results, baseline, threshold):
+    """Compare results against a baseline.
+
+    Args:
+        results (List[dict]): The entries from :func:`run_grid`.
+        baseline (List[dict]): The entries from an earlier run.
+        threshold (float): The relative slowdown (e.g. ``0.25`` for 25%)
+            beyond which an entry is flagged.
+
+    Returns:
+        List[Tuple[dict, float]]: The flagged entries and the ratio of the
+        new time to the baseline time for each.
+    """
+    baseline_times = {_key(entry): entry["ns_per_eval"] for entry in baseline}
+    slowdowns = []
+    for entry in results:
+        baseline_time = baseline_times.get(_key(entry))
+        if baseline_time is None:
+            continue
+        ratio = entry["ns_per_eval"] / baseline_time
+        if ratio > 1.0 + threshold:
+            slowdowns.append((entry, ratio))
+
+    return slowdowns
+
+
+def _int_list(value):
+    return [int(part) for part in value.split(",")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--output",
+        default=DEFAULT_OUTPUT,
+        help="Path for the JSON results (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--baseline", help="JSON results of an earlier run to compare to."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative slowdown to flag (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--degrees",
+        type=_int_list,
+        default=DEGREES,
+        help="Comma-separated degrees.",
+    )
+    parser.add_argument(
+        "--K",
+        dest="K_values",
+        type=_int_list,
+        default=K_VALUES,
+        help="Comma-separated values of K.",
+    )
+    parser.add_argument(
+        "--batch-sizes",
+        type=_int_list,
+        default=BATCH_SIZES,
+        help="Comma-separated batch sizes.",
+    )
+    args = parser.parse_args()
+
+    results = run_grid(args.degrees, args.K_values, args.batch_sizes)
+    with open(args.output, "w") as file_obj:
+        json.dump(
+            {"metadata": machine_metadata(), "results": results},
+            file_obj,
+            indent=2,
+            sort_keys=True,
+        )
+    print("Saved {}".format(args.output))
+
+    if args.baseline is None:
+        return 0
+
+    with open(args.baseline, "r") as file_obj:
+        baseline = json.load(file_obj)
+    slowdowns = compare(results, baseline["results"], args.threshold)
+    if not slowdowns:
+        print("No slowdowns (vs. {}).".format(args.baseline))
+        return 0
+
+    print("Slowdowns (vs. {}):".format(args.baseline))
+    for entry, ratio in slowdowns:
+        print(
+            "{:>26} K={} degree={:2d} batch={:4d}: {:6.2f}x".format(
+                entry["function"],
+                entry["K"],
+                entry["degree"],
+                entry["batch_size"],
+                ratio,
+            )
+        )
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
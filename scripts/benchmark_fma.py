@@ -0,0 +1,82 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Time the per-call cost of each registered FMA backend.
+
+Before timing, each backend is checked against the ``fraction`` (reference)
+backend when computing the error in a product, i.e. in the way that
+``eft.multiply_eft`` uses FMA, and on general arguments (as used by
+``operation_count.Float.fma``).
+"""
+
+from __future__ import print_function
+
+import random
+import timeit
+
+import eft
+
+
+NUM_CHECKS = 10000
+NUM_CALLS = 100000
+SEED = 418
+
+
+def check_backend(name, pairs):
+    reference = eft.FMA_BACKENDS["fraction"]
+    func = eft.FMA_BACKENDS[name]
+    for val1, val2 in pairs:
+        product = val1 * val2
+        expected = reference(val1, val2, -product)
+        assert func(val1, val2, -product) == expected, (name, val1, val2)
+        # NOTE: ``val3`` is near ``-product`` (when ``product`` is not
+        #       small) so there is cancellation in the sum.
+        val3 = val1 - product
+        expected = reference(val1, val2, val3)
+        assert func(val1, val2, val3) == expected, (name, val1, val2, val3)
+
+
+def time_backend(name, val1, val2):
+    eft.set_fma_backend(name)
+    timer = timeit.Timer(
+        "multiply_eft(val1, val2)",
+        globals={
+            "multiply_eft": eft.multiply_eft,
+            "val1": val1,
+            "val2": val2,
+        },
+    )
+    total = min(timer.repeat(repeat=3, number=NUM_CALLS))
+    return 1e9 * total / NUM_CALLS
+
+
+def main():
+    random.seed(SEED)
+    pairs = [
+        (random.uniform(-4.0, 4.0), random.uniform(-4.0, 4.0))
+        for _ in range(NUM_CHECKS)
+    ]
+
+    default_name = eft.get_fma_backend()
+    print("Default backend: {}".format(default_name))
+    print("multiply_eft() cost per call:")
+    try:
+        for name in eft.FMA_BACKENDS:
+            check_backend(name, pairs)
+            cost = time_backend(name, 1.0 + 0.5 ** 40, 1.0 - 0.5 ** 40)
+            print("  {:>8}: {:9.1f} ns".format(name, cost))
+    finally:
+        eft.set_fma_backend(default_name)
+
+
+if __name__ == "__main__":
+    main()
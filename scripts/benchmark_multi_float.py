@@ -0,0 +1,64 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare multi-component floats against ``K``-compensated de Casteljau.
+
+For ``K = 2`` (:class:`eft.DoubleDouble`) and ``K = 3``
+(:class:`eft.TripleDouble`) this times ``de_casteljau.basic()`` run on
+the multi-component type against ``de_casteljau._compensated_k()`` (plus
+the final :func:`eft.sum_k`) with the same ``K``.
+"""
+
+from __future__ import print_function
+
+import timeit
+
+import de_casteljau
+import eft
+
+
+DEGREES = (2, 4, 8, 16)
+NUM_CALLS = 200
+S_VAL = 0.5 + 0.5 ** 40
+MULTI_FLOAT_TYPES = ((2, eft.DoubleDouble), (3, eft.TripleDouble))
+
+
+def compensated_k(s, coeffs, K):
+    terms = de_casteljau._compensated_k(s, coeffs, K)
+    return eft.sum_k(terms, K)
+
+
+def multi_float(s, coeffs, multi_float_type):
+    result = de_casteljau.basic(multi_float_type(s), coeffs)
+    return float(result)
+
+
+def time_call(func, *args):
+    timer = timeit.Timer(lambda: func(*args))
+    total = min(timer.repeat(repeat=3, number=NUM_CALLS))
+    return 1e6 * total / NUM_CALLS
+
+
+def main():
+    template = "  degree {:2d}: {:9.1f} us {:9.1f} us {:8.2f}x"
+    for K, multi_float_type in MULTI_FLOAT_TYPES:
+        name = multi_float_type.__name__
+        print("K = {} ({} vs. _compensated_k):".format(K, name))
+        for degree in DEGREES:
+            coeffs = tuple((-1.0) ** j for j in range(degree + 1))
+            cost1 = time_call(multi_float, S_VAL, coeffs, multi_float_type)
+            cost2 = time_call(compensated_k, S_VAL, coeffs, K)
+            print(template.format(degree, cost1, cost2, cost1 / cost2))
+
+
+if __name__ == "__main__":
+    main()
@@ -12,16 +12,14 @@
 
 """Show an example where compensated de Casteljau is still not enough."""
 
-import fractions
-
 import matplotlib.pyplot as plt
 import numpy as np
 
 import de_casteljau
+import dyadic
 import plot_utils
 
 
-F = fractions.Fraction
 # p(s) = (2s - 1)^3 (s - 1)
 BEZIER_COEFFS = (1.0, -0.75, 0.5, -0.25, 0.0)
 ROOT = 0.5
@@ -32,15 +30,13 @@ NUM_POINTS = 401
 def main(filename=None):
     s_vals = np.linspace(ROOT - DELTA_S, ROOT + DELTA_S, NUM_POINTS)
 
-    de_casteljau2 = []
-    exact = []
-
-    for s in s_vals:
-        de_casteljau2.append(de_casteljau.compensated(s, BEZIER_COEFFS))
-
-        exact_s = F(s)
-        exact_p = (2 * exact_s - 1) ** 3 * (exact_s - 1)
-        exact.append(float(exact_p))
+    de_casteljau2 = [
+        de_casteljau.compensated(s, BEZIER_COEFFS) for s in s_vals
+    ]
+    exact = [
+        dyadic.to_float(exact_p)
+        for exact_p in dyadic.de_casteljau_many(s_vals, BEZIER_COEFFS)
+    ]
 
     figure, (ax1, ax2) = plt.subplots(1, 2, sharex=True, sharey=True)
     ax1.plot(s_vals, de_casteljau2)
@@ -15,14 +15,24 @@ r"""Perform plots of relative error against the condition number.
 This uses :math:`p(s) = (s - 1) \left(s - \frac{3}{4}\right)^7` which
 has :math:`\widetilde{p}(s) = (s - 1) \left(\frac{s}{2} -
 \frac{3}{4}\right)^7`.
+
+The exact values of :math:`p(s)` and :math:`\widetilde{p}(s)` are
+computed with :mod:`dyadic`. The condition numbers and forward errors
+are computed first, across a process pool, and then the results are
+plotted. The points are split into contiguous chunks (one per worker) and
+the results are re-assembled in order, so the output does not depend on
+the number of workers.
 """
 
+import concurrent.futures
 import fractions
+import os
 
 import matplotlib.pyplot as plt
 import numpy as np
 
 import de_casteljau
+import dyadic
 import plot_utils
 
 
@@ -40,12 +50,110 @@ BEZIER_COEFFS = (
     -1.0 / 131072.0,
     0.0,
 )
+# p_tilde(s) = SUM_j |b_j| B_{j, 8}(s) = (s - 1) (s/2 - 3/4)^7
+ABS_COEFFS = tuple(abs(coeff) for coeff in BEZIER_COEFFS)
 ROOT = 0.75
 POWER_VAL = 1.3
 ALPHA = 0.25
 
 
-def main(filename=None):
+def point_data(j, K):
+    """Compute the condition number and forward errors at a single point.
+
+    The point is :math:`s = 3/4 - 1.3^j`.
+
+    Args:
+        j (int): The exponent used to determine the point.
+        K (int): The number of compensation levels.
+
+    Returns:
+        Tuple[float, Tuple[float, ...]]: The condition number and the
+        relative forward errors when using the first ``1, ..., K``
+        components from :func:`de_casteljau._compensated_k`.
+    """
+    s = ROOT - POWER_VAL ** j
+
+    # Compute the condition number.
+    exact_p = dyadic.de_casteljau(s, BEZIER_COEFFS)
+    exact_p_tilde = dyadic.de_casteljau(s, ABS_COEFFS)
+    cond_num = abs(dyadic.ratio_to_float(exact_p_tilde, exact_p))
+
+    # Compute the forward error for (K-compensated) de Casteljau, with
+    # partial sums of the components (so the first is uncompensated).
+    components = de_casteljau._compensated_k(s, BEZIER_COEFFS, K)
+    forward_errs = []
+    b = components[0]
+    for index in range(K):
+        if index > 0:
+            b = b + components[index]
+        exact_err = dyadic.subtract(dyadic.from_float(b), exact_p)
+        forward_errs.append(abs(dyadic.ratio_to_float(exact_err, exact_p)))
+
+    return cond_num, tuple(forward_errs)
+
+
+def _chunk_data(exponents, K):
+    # Helper for ``sweep_data`` (run in a worker process).
+    return [point_data(j, K) for j in exponents]
+
+
+def sweep_data(exponents, K, num_workers=None):
+    """Compute condition numbers and forward errors at many points.
+
+    Args:
+        exponents (Sequence[int]): The exponents ``j`` used to determine
+            the points (see :func:`point_data`).
+        K (int): The number of compensation levels.
+        num_workers (Optional[int]): The number of worker processes.
+            Defaults to the number of CPUs. If ``1``, no process pool is
+            used.
+
+    Returns:
+        Tuple[List[float], List[List[float]]]: The condition numbers and
+        ``K`` lists of forward errors (one for each number of
+        components), in the same order as ``exponents``.
+    """
+    exponents = list(exponents)
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    num_workers = max(1, min(num_workers, len(exponents)))
+
+    if num_workers == 1:
+        all_data = _chunk_data(exponents, K)
+    else:
+        chunk_size = -(-len(exponents) // num_workers)
+        chunks = [
+            exponents[start : start + chunk_size]
+            for start in range(0, len(exponents), chunk_size)
+        ]
+        with concurrent.futures.ProcessPoolExecutor(num_workers) as executor:
+            # NOTE: ``map()`` returns results in the order of ``chunks``.
+            chunk_results = executor.map(
+                _chunk_data, chunks, [K] * len(chunks)
+            )
+            all_data = [
+                data for chunk_data in chunk_results for data in chunk_data
+            ]
+
+    cond_nums = [cond_num for cond_num, _ in all_data]
+    forward_errs = [
+        [errs[index] for _, errs in all_data] for index in range(K)
+    ]
+    return cond_nums, forward_errs
+
+
+def main(filename=None, exponents=None, num_workers=None):
+    """Plot relative forward error against the condition number.
+
+    Args:
+        filename (Optional[str]): The file to save the plot in. If not
+            provided, the plot is displayed.
+        exponents (Optional[Sequence[int]]): The exponents ``j`` used
+            to determine the points :math:`s = 3/4 - 1.3^j`. Defaults
+            to :math:`-5, -6, \\ldots, -90`.
+        num_workers (Optional[int]): The number of worker processes used
+            to compute the data (see :func:`sweep_data`).
+    """
     n = 8
     gamma2n = (2 * n * U) / (1 - 2 * n * U)
     bound_coeff1 = float(gamma2n)
@@ -58,45 +166,10 @@ def main(filename=None):
     )
     bound_coeff4 = float(bound_coeff4)
 
-    cond_nums = []
-    forward_errs1 = []
-    forward_errs2 = []
-    forward_errs3 = []
-    forward_errs4 = []
-    for j in range(-5, -90 - 1, -1):
-        s = ROOT - POWER_VAL ** j
-        exact_s = F(s)
-
-        # Compute the condition number.
-        exact_p = (exact_s - 1) * (4 * exact_s - 3) ** 7 / 16384
-        # p_tilde(s) = SUM_j |b_j| B_{j, 8}(s) = (s - 1) (s/2 - 3/4)^7
-        exact_p_tilde = (exact_s - 1) * (2 * exact_s - 3) ** 7 / 16384
-        exact_cond = abs(exact_p_tilde / exact_p)
-        cond_nums.append(float(exact_cond))
-
-        # Compute the forward error for uncompensated de Casteljau.
-        b, db, d2b, d3b = de_casteljau._compensated_k(s, BEZIER_COEFFS, 4)
-        exact_b1 = F(b)
-        exact_forward_err1 = abs((exact_b1 - exact_p) / exact_p)
-        forward_errs1.append(float(exact_forward_err1))
-
-        # Compute the forward error for compensated de Casteljau.
-        b2 = b + db
-        exact_b2 = F(b2)
-        exact_forward_err2 = abs((exact_b2 - exact_p) / exact_p)
-        forward_errs2.append(float(exact_forward_err2))
-
-        # Compute the forward error for K-compensated de Casteljau (K=3).
-        b3 = b2 + d2b
-        exact_b3 = F(b3)
-        exact_forward_err3 = abs((exact_b3 - exact_p) / exact_p)
-        forward_errs3.append(float(exact_forward_err3))
-
-        # Compute the forward error for K-compensated de Casteljau (K=3).
-        b4 = b3 + d3b
-        exact_b4 = F(b4)
-        exact_forward_err4 = abs((exact_b4 - exact_p) / exact_p)
-        forward_errs4.append(float(exact_forward_err4))
+    if exponents is None:
+        exponents = range(-5, -90 - 1, -1)
+    cond_nums, forward_errs = sweep_data(exponents, 4, num_workers)
+    forward_errs1, forward_errs2, forward_errs3, forward_errs4 = forward_errs
 
     # Set a tight ``x``-limit.
     min_exp = np.log(min(cond_nums))
@@ -246,7 +319,7 @@ def main(filename=None):
         plt.close(figure)
 
 
-def main_jlcs10(filename=None):
+def main_jlcs10(filename=None, exponents=None, num_workers=None):
     """This recreates the plot from `JLCS10`_.
 
     .. _JLCS10: https://doi.org/10.1016/j.camwa.2010.05.021
@@ -258,6 +331,15 @@ def main_jlcs10(filename=None):
     what happens as the exponent on ``POWER_VAL`` decreases from ``-44`` down
     to ``-64``. In particular, it shows that the compensated de Casteljau
     algorithm produces exactly zero.
+
+    Args:
+        filename (Optional[str]): The file to save the plot in. If not
+            provided, the plot is displayed.
+        exponents (Optional[Sequence[int]]): The exponents ``j`` used
+            to determine the points :math:`s = 3/4 - 1.3^j`. Defaults
+            to :math:`-5, -6, \\ldots, -64`.
+        num_workers (Optional[int]): The number of worker processes used
+            to compute the data (see :func:`sweep_data`).
     """
     n = 8
     gamma2n = (2 * n * U) / (1 - 2 * n * U)
@@ -265,31 +347,10 @@ def main_jlcs10(filename=None):
     bound_coeff2 = 3 * n * (3 * n + 7) * U ** 2 / 2
     bound_coeff2 = float(bound_coeff2)
 
-    cond_nums = []
-    forward_errs1 = []
-    forward_errs2 = []
-    for j in range(-5, -64 - 1, -1):
-        s = ROOT - POWER_VAL ** j
-        exact_s = F(s)
-
-        # Compute the condition number.
-        exact_p = (exact_s - 1) * (4 * exact_s - 3) ** 7 / 16384
-        # p_tilde(s) = SUM_j |b_j| B_{j, 8}(s) = (s - 1) (s/2 - 3/4)^7
-        exact_p_tilde = (exact_s - 1) * (2 * exact_s - 3) ** 7 / 16384
-        exact_cond = abs(exact_p_tilde / exact_p)
-        cond_nums.append(float(exact_cond))
-
-        # Compute the forward error for uncompensated de Casteljau.
-        b, db = de_casteljau._compensated_k(s, BEZIER_COEFFS, 2)
-        exact_b1 = F(b)
-        exact_forward_err1 = abs((exact_b1 - exact_p) / exact_p)
-        forward_errs1.append(float(exact_forward_err1))
-
-        # Compute the forward error for compensated de Casteljau.
-        b2 = b + db
-        exact_b2 = F(b2)
-        exact_forward_err2 = abs((exact_b2 - exact_p) / exact_p)
-        forward_errs2.append(float(exact_forward_err2))
+    if exponents is None:
+        exponents = range(-5, -64 - 1, -1)
+    cond_nums, forward_errs = sweep_data(exponents, 2, num_workers)
+    forward_errs1, forward_errs2 = forward_errs
 
     # Set a tight ``x``-limit.
     min_exp = np.log(min(cond_nums))
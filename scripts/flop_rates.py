@@ -0,0 +1,252 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare measured time against the flop counts from ``compute_counts``.
+
+For each ``(K, degree)`` the C, C++ and Python implementations of
+(``K``-compensated) de Casteljau are timed and the time per evaluation
+is reported along with the achieved flops per nanosecond, using the
+closed-form flop counts (e.g.
+:func:`compute_counts.de_casteljau_expected_total`). Since only Python
+implements Horner's method, it is reported for Python alone.
+
+The C and C++ timings come from ``scripts/timing.c`` and
+``scripts/timing.cpp`` (compiled with the same flags as the
+``verify_c`` / ``verify_cpp`` sessions). For C, the structure-of-arrays
+block kernel (``compensated_block_batch()``) is also timed: since it
+performs the same flops as the scalar kernel, comparing the two shows
+how far the scalar kernel is from being throughput-bound (rather than
+bound by the latency of its dependency chains).
+"""
+
+from __future__ import print_function
+
+import os
+import shutil
+import subprocess
+import tempfile
+import timeit
+
+import compute_counts
+import de_casteljau
+import eft
+import horner
+
+
+K_VALUES = (1, 2, 3, 4, 5)
+DEGREES = (1, 2, 4, 8, 16)
+NUM_PY_POINTS = 64
+NUM_REPEAT = 3
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(SCRIPTS_DIR), "src")
+IMPLEMENTATIONS = (
+    ("c", "C"),
+    ("c_block", "C (block)"),
+    ("cpp", "C++"),
+    ("python", "Python"),
+)
+DE_CASTELJAU_FUNCS = {
+    1: de_casteljau.basic,
+    2: de_casteljau.compensated,
+    3: de_casteljau.compensated3,
+    4: de_casteljau.compensated4,
+    5: de_casteljau.compensated5,
+}
+
+
+def de_casteljau_flops(K, degree):
+    """Get the flop count for (``K``-compensated) de Casteljau."""
+    if K == 1:
+        Tn = (degree * (degree + 1)) // 2
+        return 3 * Tn + 1
+
+    return compute_counts.de_casteljau_expected_total(K, degree)
+
+
+def horner_flops(K, degree):
+    """Get the flop count for (``K``-compensated) Horner's method."""
+    if K == 1:
+        return 2 * degree
+
+    return compute_counts.horner_expected_total(K, degree)
+
+
+def get_coeffs(degree):
+    # NOTE: These must match the coefficients in ``timing.c/cpp``.
+    return tuple((-1.0) ** j * (1.0 + j / 8.0) for j in range(degree + 1))
+
+
+def _horner(K):
+    if K == 1:
+        return horner.basic
+    if K == 2:
+        return horner.compensated
+    if K == 3:
+        return horner.compensated3
+
+    def func(x, coeffs):
+        return horner.compensated_k(x, coeffs, K)
+
+    return func
+
+
+def _de_casteljau(K):
+    if K in DE_CASTELJAU_FUNCS:
+        return DE_CASTELJAU_FUNCS[K]
+
+    def func(s, coeffs):
+        return eft.sum_k(de_casteljau._compensated_k(s, coeffs, K), K)
+
+    return func
+
+
+def time_python(func, degree):
+    """Time a Python evaluator (in nanoseconds per evaluation)."""
+    coeffs = get_coeffs(degree)
+    s_vals = [(i + 0.5) / NUM_PY_POINTS for i in range(NUM_PY_POINTS)]
+
+    def sweep():
+        for s in s_vals:
+            func(s, coeffs)
+
+    total = min(timeit.Timer(sweep).repeat(repeat=NUM_REPEAT, number=1))
+    return 1e9 * total / NUM_PY_POINTS
+
+
+def run_native(compiler, flags, source, sources, max_k, degrees):
+    """Compile and run a timing program.
+
+    Returns:
+        Dict[Tuple[str, int, int], float]: The nanoseconds per evaluation
+        for each ``(impl, K, degree)``. Empty if ``compiler`` is not
+        installed (or compilation fails).
+    """
+    if shutil.which(compiler) is None:
+        return {}
+
+    build_dir = tempfile.mkdtemp()
+    try:
+        executable = os.path.join(build_dir, "timing")
+        command = (
+            [compiler]
+            + list(flags)
+            + ["-o", executable, os.path.join(SCRIPTS_DIR, source)]
+            + [os.path.join(SRC_DIR, name) for name in sources]
+            + ["-I", SRC_DIR, "-lm"]
+        )
+        try:
+            subprocess.check_call(command)
+        except (OSError, subprocess.CalledProcessError):
+            return {}
+
+        args = [str(max_k)] + [str(degree) for degree in degrees]
+        output = subprocess.check_output([executable] + args)
+    finally:
+        shutil.rmtree(build_dir)
+
+    timings = {}
+    for line in output.decode("ascii").splitlines():
+        impl, K, degree, ns_per_eval, _ = line.split()
+        timings[(impl, int(K), int(degree))] = float(ns_per_eval)
+
+    return timings
+
+
+def _format_cell(ns_per_eval, flops):
+    if ns_per_eval is None:
+        return "{:>9} {:>6}".format("-", "-")
+
+    return "{:9.1f} {:6.3f}".format(ns_per_eval, flops / ns_per_eval)
+
+
+def print_table(method, rows, timings, implementations=IMPLEMENTATIONS):
+    """Print ns/eval and flops/ns for each implementation.
+
+    Args:
+        method (str): The name of the method.
+        rows (List[Tuple[int, int, int]]): Triples of ``K``, degree and
+            flop count.
+        timings (Dict[Tuple[str, int, int], float]): The nanoseconds per
+            evaluation for each ``(impl, K, degree)``.
+        implementations (Optional[Sequence[Tuple[str, str]]]): Pairs of
+            implementation (as used in ``timings``) and label. Defaults
+            to every implementation.
+    """
+    header = "{:>2} {:>3} {:>7}".format("K", "n", "flops")
+    sub_header = " " * len(header)
+    for _, label in implementations:
+        header += " | {:>16}".format(label)
+        sub_header += " | {:>9} {:>6}".format("ns/eval", "f/ns")
+
+    print("{}:".format(method))
+    print(header)
+    print(sub_header)
+    for K, degree, flops in rows:
+        line = "{:2d} {:3d} {:7d}".format(K, degree, flops)
+        for impl, _ in implementations:
+            ns_per_eval = timings.get((impl, K, degree))
+            line += " | " + _format_cell(ns_per_eval, flops)
+        print(line)
+
+
+def main():
+    max_k = max(K_VALUES)
+    timings = {}
+    timings.update(
+        run_native(
+            "gcc",
+            ("-std=c99", "-O3", "-march=native"),
+            "timing.c",
+            ("de_casteljau.c", "eft.c"),
+            max_k,
+            DEGREES,
+        )
+    )
+    timings.update(
+        run_native(
+            "g++",
+            ("-std=c++11", "-O3", "-march=native"),
+            "timing.cpp",
+            ("de_casteljau.cpp", "eft.cpp"),
+            max_k,
+            DEGREES,
+        )
+    )
+
+    de_casteljau_rows = []
+    horner_timings = {}
+    horner_rows = []
+    for K in K_VALUES:
+        for degree in DEGREES:
+            de_casteljau_rows.append(
+                (K, degree, de_casteljau_flops(K, degree))
+            )
+            timings[("python", K, degree)] = time_python(
+                _de_casteljau(K), degree
+            )
+            # NOTE: The closed-form count for compensated Horner only
+            #       holds for ``n >= K - 1``.
+            if degree >= K - 1:
+                horner_rows.append((K, degree, horner_flops(K, degree)))
+                horner_timings[("python", K, degree)] = time_python(
+                    _horner(K), degree
+                )
+
+    print_table("de Casteljau", de_casteljau_rows, timings)
+    print(compute_counts.SEPARATOR)
+    print_table(
+        "Horner", horner_rows, horner_timings, IMPLEMENTATIONS[-1:]
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -35,11 +35,10 @@ def main(filename=None):
     s_vals = np.linspace(ROOT - DELTA_S, ROOT + DELTA_S, NUM_POINTS)
 
     horner1 = []
-    de_casteljau1 = []
-
     for s in s_vals:
         horner1.append(horner.basic(s, POLY_COEFFS))
-        de_casteljau1.append(de_casteljau.basic(s, BEZIER_COEFFS))
+
+    de_casteljau1 = de_casteljau.basic_many(s_vals, BEZIER_COEFFS)
 
     figure, (ax1, ax2) = plt.subplots(1, 2, sharex=True, sharey=True)
     ax1.plot(s_vals, horner1)
@@ -14,6 +14,8 @@
 #include "eft.h"
 #include <math.h>
 #include <stdio.h>
+#include <string.h>
+#include <time.h>
 
 void print_sep(void)
 {
@@ -22,6 +24,150 @@ void print_sep(void)
 
 void print_small_sep(void) { printf("******************************\n"); }
 
+#define NUM_BATCH 1000
+#define NUM_TIMED 100000
+#define NUM_REPEAT 20
+
+int check_batch(const double* coeffs, size_t degree)
+{
+    // NOTE: This requires ``degree <= 3``.
+    double s_vals[NUM_BATCH];
+    double batch_result[4 * NUM_BATCH];
+    double batch_basic[NUM_BATCH];
+    double errors[13]; // length(errors) >= 5K - 7; K <= 4;
+    double bk[16]; // length(bk) >= K(degree + 1); K <= 4; degree <= 3;
+    double pk[4];
+    double result[4];
+    int num_mismatch = 0;
+
+    for (size_t i = 0; i < NUM_BATCH; ++i) {
+        s_vals[i] = 2.0 * i / (NUM_BATCH - 1) - 0.5 + pow(0.5, 50);
+    }
+
+    if (basic_batch(s_vals, NUM_BATCH, coeffs, degree, batch_basic) != 0) {
+        printf("basic_batch() failed\n");
+        return -1;
+    }
+    for (size_t i = 0; i < NUM_BATCH; ++i) {
+        double evaluated = basic(s_vals[i], coeffs, pk, degree);
+        if (memcmp(&evaluated, &batch_basic[i], sizeof(double)) != 0) {
+            ++num_mismatch;
+        }
+    }
+    printf("basic_batch(): %d mismatches\n", num_mismatch);
+
+    for (size_t K = 2; K <= 4; ++K) {
+        int mismatch_k = 0;
+        if (compensated_batch(s_vals, NUM_BATCH, coeffs, degree, K,
+                batch_result)
+            != 0) {
+            printf("compensated_batch() failed\n");
+            return -1;
+        }
+        for (size_t i = 0; i < NUM_BATCH; ++i) {
+            compensated(s_vals[i], coeffs, degree, K, errors, bk, result);
+            if (memcmp(result, &batch_result[K * i], K * sizeof(double))
+                != 0) {
+                ++mismatch_k;
+            }
+        }
+        printf("compensated_batch(K = %zu): %d mismatches\n", K, mismatch_k);
+        num_mismatch += mismatch_k;
+    }
+
+    return num_mismatch;
+}
+
+int check_block(const double* coeffs, size_t degree)
+{
+    // NOTE: This requires ``degree <= 3``.
+    double s_vals[NUM_BATCH];
+    double block_result[4 * NUM_BATCH];
+    double errors[13]; // length(errors) >= 5K - 7; K <= 4;
+    double bk[16]; // length(bk) >= K(degree + 1); K <= 4; degree <= 3;
+    double result[4];
+    int num_mismatch = 0;
+
+    // NOTE: ``NUM_BATCH`` is not a multiple of ``DE_CASTELJAU_BLOCK_WIDTH``,
+    //       so the (padded) last block is also checked.
+    for (size_t i = 0; i < NUM_BATCH; ++i) {
+        s_vals[i] = 2.0 * i / (NUM_BATCH - 1) - 0.5 + pow(0.5, 50);
+    }
+
+    for (size_t K = 2; K <= 4; ++K) {
+        int mismatch_k = 0;
+        if (compensated_block_batch(s_vals, NUM_BATCH, coeffs, degree, K,
+                block_result)
+            != 0) {
+            printf("compensated_block_batch() failed\n");
+            return -1;
+        }
+        for (size_t i = 0; i < NUM_BATCH; ++i) {
+            compensated(s_vals[i], coeffs, degree, K, errors, bk, result);
+            if (memcmp(result, &block_result[K * i], K * sizeof(double))
+                != 0) {
+                ++mismatch_k;
+            }
+        }
+        printf("compensated_block_batch(K = %zu): %d mismatches\n", K,
+            mismatch_k);
+        num_mismatch += mismatch_k;
+    }
+
+    return num_mismatch;
+}
+
+double elapsed_ns(clock_t start)
+{
+    return 1e9 * (double)(clock() - start) / CLOCKS_PER_SEC;
+}
+
+int time_block(const double* coeffs, size_t degree)
+{
+    // NOTE: This requires ``degree <= 3``.
+    static double s_vals[NUM_TIMED];
+    static double block_result[4 * NUM_TIMED];
+    double errors[13]; // length(errors) >= 5K - 7; K <= 4;
+    double bk[16]; // length(bk) >= K(degree + 1); K <= 4; degree <= 3;
+    double result[4];
+
+    for (size_t i = 0; i < NUM_TIMED; ++i) {
+        s_vals[i] = (double)i / NUM_TIMED;
+    }
+
+    for (size_t K = 2; K <= 4; ++K) {
+        // NOTE: The sum of the results is printed so the compiler can't
+        //       discard the serial loop.
+        double total = 0.0;
+        clock_t start = clock();
+        for (size_t repeat = 0; repeat < NUM_REPEAT; ++repeat) {
+            for (size_t i = 0; i < NUM_TIMED; ++i) {
+                compensated(s_vals[i], coeffs, degree, K, errors, bk, result);
+                total += result[0];
+            }
+        }
+        double serial_ns = elapsed_ns(start) / (NUM_REPEAT * NUM_TIMED);
+
+        start = clock();
+        for (size_t repeat = 0; repeat < NUM_REPEAT; ++repeat) {
+            if (compensated_block_batch(s_vals, NUM_TIMED, coeffs, degree, K,
+                    block_result)
+                != 0) {
+                printf("compensated_block_batch() failed\n");
+                return -1;
+            }
+            total += block_result[0];
+        }
+        double block_ns = elapsed_ns(start) / (NUM_REPEAT * NUM_TIMED);
+
+        printf("K = %zu: serial %.2f ns/point, block %.2f ns/point "
+               "(%.2fx; checksum %e)\n",
+            K, serial_ns, block_ns, serial_ns / block_ns, total);
+    }
+
+    return 0;
+}
+
 int main(void)
 {
     double product, error;
@@ -107,5 +253,17 @@ int main(void)
         print_small_sep();
     }
 
-    return 0;
+    print_sep();
+    printf("Batch (vs. serial):\n");
+    int num_mismatch = check_batch(coeffs3, 3);
+    num_mismatch += check_block(coeffs3, 3);
+    printf("Mismatches: %d\n", num_mismatch);
+
+    print_sep();
+    printf("Throughput (p3, block width = %d):\n", DE_CASTELJAU_BLOCK_WIDTH);
+    if (time_block(coeffs3, 3) != 0) {
+        return 1;
+    }
+
+    return num_mismatch == 0 ? 0 : 1;
 }
@@ -10,14 +10,95 @@
 // See the License for the specific language governing permissions and
 // limitations under the License.
 
+#include "de_casteljau.h"
 #include "de_casteljau.hpp"
 #include "eft.hpp"
 #include <array>
+#include <chrono>
 #include <cmath>
+#include <iomanip>
 #include <iostream>
 #include <string>
 #include <vector>
 
+const size_t NUM_TIMED = 100000;
+const size_t NUM_REPEAT = 20;
+
+double elapsed_ns(std::chrono::steady_clock::time_point start)
+{
+    std::chrono::duration<double, std::nano> elapsed
+        = std::chrono::steady_clock::now() - start;
+    return elapsed.count();
+}
+
+template <size_t K, size_t degree>
+int time_block(const std::array<double, degree + 1>& coeffs)
+{
+    // NOTE: ``NUM_TIMED`` is a multiple of ``DE_CASTELJAU_BLOCK_WIDTH``.
+    std::vector<de_casteljau::Lanes<DE_CASTELJAU_BLOCK_WIDTH>> s_vals(
+        NUM_TIMED / DE_CASTELJAU_BLOCK_WIDTH);
+    for (size_t i = 0; i < NUM_TIMED; ++i) {
+        s_vals[i / DE_CASTELJAU_BLOCK_WIDTH][i % DE_CASTELJAU_BLOCK_WIDTH]
+            = (double)i / NUM_TIMED;
+    }
+
+    // NOTE: The sums of the results are printed so the compiler can't
+    //       discard either loop.
+    double serial_total = 0.0;
+    auto start = std::chrono::steady_clock::now();
+    for (size_t repeat = 0; repeat < NUM_REPEAT; ++repeat) {
+        for (size_t i = 0; i < NUM_TIMED; ++i) {
+            std::array<double, K> result
+                = de_casteljau::compensated<K, degree>(
+                    s_vals[i / DE_CASTELJAU_BLOCK_WIDTH]
+                          [i % DE_CASTELJAU_BLOCK_WIDTH],
+                    coeffs);
+            serial_total += result[0];
+        }
+    }
+    double serial_ns = elapsed_ns(start) / (NUM_REPEAT * NUM_TIMED);
+
+    double block_total = 0.0;
+    start = std::chrono::steady_clock::now();
+    for (size_t repeat = 0; repeat < NUM_REPEAT; ++repeat) {
+        for (size_t b = 0; b < s_vals.size(); ++b) {
+            std::array<de_casteljau::Lanes<DE_CASTELJAU_BLOCK_WIDTH>, K> result
+                = de_casteljau::compensated_block<K, degree,
+                    DE_CASTELJAU_BLOCK_WIDTH>(s_vals[b], coeffs);
+            for (size_t lane = 0; lane < DE_CASTELJAU_BLOCK_WIDTH; ++lane) {
+                block_total += result[0][lane];
+            }
+        }
+    }
+    double block_ns = elapsed_ns(start) / (NUM_REPEAT * NUM_TIMED);
+
+    // Make sure every component matches bit-for-bit.
+    int num_mismatch = 0;
+    for (size_t b = 0; b < s_vals.size(); ++b) {
+        std::array<de_casteljau::Lanes<DE_CASTELJAU_BLOCK_WIDTH>, K> block
+            = de_casteljau::compensated_block<K, degree,
+                DE_CASTELJAU_BLOCK_WIDTH>(s_vals[b], coeffs);
+        for (size_t lane = 0; lane < DE_CASTELJAU_BLOCK_WIDTH; ++lane) {
+            std::array<double, K> result
+                = de_casteljau::compensated<K, degree>(
+                    s_vals[b][lane], coeffs);
+            for (size_t F = 0; F < K; ++F) {
+                if (result[F] != block[F][lane]) {
+                    ++num_mismatch;
+                    break;
+                }
+            }
+        }
+    }
+
+    std::cout << "K = " << K << ": serial " << serial_ns
+              << " ns/point, block " << block_ns << " ns/point ("
+              << serial_ns / block_ns << "x; " << num_mismatch
+              << " mismatches; checksums " << serial_total << ", "
+              << block_total << ")" << std::endl;
+    return num_mismatch;
+}
+
 int main()
 {
     std::pair<double, double> eft_result
@@ -130,5 +211,13 @@ int main()
         std::cout << std::string(30, '*') << std::endl;
     }
 
-    return 0;
+    std::cout << std::string(60, '=') << std::endl;
+    std::cout << "Throughput (p3, block width = " << DE_CASTELJAU_BLOCK_WIDTH
+              << "):" << std::endl;
+    std::cout << std::fixed << std::setprecision(2);
+    int num_mismatch = time_block<2, 3>(coeffs3);
+    num_mismatch += time_block<3, 3>(coeffs3);
+    num_mismatch += time_block<4, 3>(coeffs3);
+
+    return num_mismatch == 0 ? 0 : 1;
 }
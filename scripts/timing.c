@@ -0,0 +1,152 @@
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     https://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+// Usage: ``timing MAX_K DEGREE [DEGREE ...]``
+//
+// For each ``K = 1, ..., MAX_K`` and each degree, prints a line
+// ``IMPL K DEGREE NS_PER_EVAL CHECKSUM``. ``K = 1`` is ``basic()``, otherwise
+// ``compensated()`` (``IMPL = c``) or ``compensated_block_batch()``
+// (``IMPL = c_block``) followed by ``sum_k()``. This is driven by
+// ``scripts/flop_rates.py``.
+
+#include "de_casteljau.h"
+#include "eft.h"
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+#define NUM_POINTS 4096
+#define MIN_SECONDS 0.05
+
+typedef struct {
+    const double* s_vals;
+    const double* coeffs;
+    size_t degree;
+    size_t K;
+    double* errors;
+    double* bk;
+    double* result;
+    double* workspace;
+    double* block_result;
+} problem;
+
+typedef double (*sweep_func)(const problem* prob);
+
+double sweep_basic(const problem* prob)
+{
+    double total = 0.0;
+    for (size_t i = 0; i < NUM_POINTS; ++i) {
+        total += basic(prob->s_vals[i], prob->coeffs, prob->bk, prob->degree);
+    }
+    return total;
+}
+
+double sweep_compensated(const problem* prob)
+{
+    double total = 0.0;
+    for (size_t i = 0; i < NUM_POINTS; ++i) {
+        compensated(prob->s_vals[i], prob->coeffs, prob->degree, prob->K,
+            prob->errors, prob->bk, prob->result);
+        total += sum_k(prob->result, prob->workspace, prob->K, prob->K);
+    }
+    return total;
+}
+
+double sweep_block(const problem* prob)
+{
+    double total = 0.0;
+    if (compensated_block_batch(prob->s_vals, NUM_POINTS, prob->coeffs,
+            prob->degree, prob->K, prob->block_result)
+        != 0) {
+        fprintf(stderr, "compensated_block_batch() failed\n");
+        exit(1);
+    }
+    for (size_t i = 0; i < NUM_POINTS; ++i) {
+        total += sum_k(&prob->block_result[prob->K * i], prob->workspace,
+            prob->K, prob->K);
+    }
+    return total;
+}
+
+double time_sweep(sweep_func func, const problem* prob, double* checksum)
+{
+    // NOTE: The number of sweeps is doubled until the elapsed (CPU) time
+    //       is long enough to be measured reliably.
+    size_t num_sweeps = 1;
+    while (1) {
+        clock_t start = clock();
+        for (size_t i = 0; i < num_sweeps; ++i) {
+            *checksum += func(prob);
+        }
+        double elapsed = (double)(clock() - start) / CLOCKS_PER_SEC;
+        if (elapsed >= MIN_SECONDS) {
+            return 1e9 * elapsed / (num_sweeps * NUM_POINTS);
+        }
+        num_sweeps *= 2;
+    }
+}
+
+void print_timing(
+    const char* impl, sweep_func func, const problem* prob, size_t K)
+{
+    double checksum = 0.0;
+    double ns_per_eval = time_sweep(func, prob, &checksum);
+    printf("%s %zu %zu %f %e\n", impl, K, prob->degree, ns_per_eval,
+        checksum);
+}
+
+int main(int argc, char** argv)
+{
+    if (argc < 3) {
+        fprintf(stderr, "Usage: %s MAX_K DEGREE [DEGREE ...]\n", argv[0]);
+        return 1;
+    }
+    size_t max_k = strtoul(argv[1], NULL, 10);
+
+    double* s_vals = malloc(NUM_POINTS * sizeof(double));
+    for (size_t i = 0; i < NUM_POINTS; ++i) {
+        s_vals[i] = (i + 0.5) / NUM_POINTS;
+    }
+
+    for (int arg = 2; arg < argc; ++arg) {
+        size_t degree = strtoul(argv[arg], NULL, 10);
+        size_t max_k_alloc = max_k < 2 ? 2 : max_k;
+
+        double* coeffs = malloc((degree + 1) * sizeof(double));
+        for (size_t j = 0; j <= degree; ++j) {
+            coeffs[j] = (j % 2 == 0 ? 1.0 : -1.0) * (1.0 + j / 8.0);
+        }
+        problem prob = { s_vals, coeffs, degree, 1,
+            malloc((5 * max_k_alloc - 7) * sizeof(double)),
+            malloc(max_k_alloc * (degree + 1) * sizeof(double)),
+            malloc(max_k_alloc * sizeof(double)),
+            malloc(max_k_alloc * sizeof(double)),
+            malloc(max_k_alloc * NUM_POINTS * sizeof(double)) };
+
+        print_timing("c", sweep_basic, &prob, 1);
+        for (size_t K = 2; K <= max_k; ++K) {
+            prob.K = K;
+            print_timing("c", sweep_compensated, &prob, K);
+            print_timing("c_block", sweep_block, &prob, K);
+        }
+
+        free(coeffs);
+        free(prob.errors);
+        free(prob.bk);
+        free(prob.result);
+        free(prob.workspace);
+        free(prob.block_result);
+    }
+
+    free(s_vals);
+    return 0;
+}
@@ -0,0 +1,99 @@
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     https://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+// Usage: ``timing MAX_K DEGREE [DEGREE ...]``
+//
+// For each ``K = 1, ..., MAX_K`` and each degree, prints a line
+// ``cpp K DEGREE NS_PER_EVAL CHECKSUM``. ``K = 1`` is ``basic()``, otherwise
+// ``compensated_k()`` followed by ``eft::sum_k()``. This is driven by
+// ``scripts/flop_rates.py``.
+
+#include "de_casteljau.hpp"
+#include "eft.hpp"
+#include <chrono>
+#include <cstdlib>
+#include <functional>
+#include <iostream>
+#include <string>
+#include <vector>
+
+const size_t NUM_POINTS = 4096;
+const double MIN_SECONDS = 0.05;
+
+double time_sweep(const std::function<double(double)>& func,
+    const std::vector<double>& s_vals, double& checksum)
+{
+    // NOTE: The number of sweeps is doubled until the elapsed time is long
+    //       enough to be measured reliably.
+    for (size_t num_sweeps = 1;; num_sweeps *= 2) {
+        auto start = std::chrono::steady_clock::now();
+        for (size_t i = 0; i < num_sweeps; ++i) {
+            for (double s : s_vals) {
+                checksum += func(s);
+            }
+        }
+        std::chrono::duration<double> elapsed
+            = std::chrono::steady_clock::now() - start;
+        if (elapsed.count() >= MIN_SECONDS) {
+            return 1e9 * elapsed.count() / (num_sweeps * s_vals.size());
+        }
+    }
+}
+
+void print_timing(size_t K, size_t degree,
+    const std::function<double(double)>& func,
+    const std::vector<double>& s_vals)
+{
+    double checksum = 0.0;
+    double ns_per_eval = time_sweep(func, s_vals, checksum);
+    std::cout << "cpp " << K << " " << degree << " " << std::fixed
+              << ns_per_eval << " " << std::scientific << checksum
+              << std::endl;
+}
+
+int main(int argc, char** argv)
+{
+    if (argc < 3) {
+        std::cerr << "Usage: " << argv[0] << " MAX_K DEGREE [DEGREE ...]"
+                  << std::endl;
+        return 1;
+    }
+    size_t max_k = std::strtoul(argv[1], nullptr, 10);
+
+    std::vector<double> s_vals(NUM_POINTS);
+    for (size_t i = 0; i < NUM_POINTS; ++i) {
+        s_vals[i] = (i + 0.5) / NUM_POINTS;
+    }
+
+    for (int arg = 2; arg < argc; ++arg) {
+        size_t degree = std::strtoul(argv[arg], nullptr, 10);
+        std::vector<double> coeffs(degree + 1);
+        for (size_t j = 0; j <= degree; ++j) {
+            coeffs[j] = (j % 2 == 0 ? 1.0 : -1.0) * (1.0 + j / 8.0);
+        }
+
+        print_timing(1, degree,
+            [&coeffs](double s) { return de_casteljau::basic(s, coeffs); },
+            s_vals);
+        for (size_t K = 2; K <= max_k; ++K) {
+            print_timing(K, degree,
+                [&coeffs, K](double s) {
+                    std::vector<double> terms
+                        = de_casteljau::compensated_k(s, coeffs, K);
+                    return eft::sum_k(terms, K);
+                },
+                s_vals);
+        }
+    }
+
+    return 0;
+}
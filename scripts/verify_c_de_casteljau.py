@@ -0,0 +1,90 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Verify the batch functions in ``c_de_casteljau``.
+
+This checks that ``basic_batch()`` and ``compensated_batch()`` match the
+scalar Python functions bit-for-bit (including batches that are split
+into chunks), that empty batches produce empty results of the same
+shape and that the shared library is only loaded from a private
+directory.
+"""
+
+import os
+import random
+
+import numpy as np
+
+import c_de_casteljau
+import de_casteljau
+
+
+SEED = 1618
+DEGREE = 5
+NUM_POINTS = 10000
+SHAPES = ((0,), (3, 0), (0, 4))
+COMPENSATED = {
+    2: de_casteljau.compensated,
+    3: de_casteljau.compensated3,
+    4: de_casteljau.compensated4,
+    5: de_casteljau.compensated5,
+}
+
+
+def verify_private():
+    path = c_de_casteljau.build_library()
+    assert path is not None
+    assert c_de_casteljau._is_private(os.path.dirname(path)), path
+    assert c_de_casteljau._is_private(path), path
+
+
+def verify_empty():
+    coeffs = (1.0, -2.0, 3.0)
+    for shape in SHAPES:
+        s_vals = np.empty(shape)
+        result = c_de_casteljau.basic_batch(s_vals, coeffs)
+        assert result.shape == shape, (result.shape, shape)
+        for K in COMPENSATED:
+            result = c_de_casteljau.compensated_batch(s_vals, coeffs, K=K)
+            assert result.shape == shape, (K, result.shape, shape)
+
+
+def verify_values():
+    rand_gen = random.Random(SEED)
+    coeffs = tuple(rand_gen.uniform(-1.0, 1.0) for _ in range(DEGREE + 1))
+    s_vals = np.array([rand_gen.random() for _ in range(NUM_POINTS)])
+
+    # NOTE: Use more than one thread so the batch is split into chunks.
+    result = c_de_casteljau.basic_batch(s_vals, coeffs, num_threads=2)
+    for s, value in zip(s_vals, result):
+        assert value == de_casteljau.basic(s, coeffs), s
+
+    for K, func in COMPENSATED.items():
+        result = c_de_casteljau.compensated_batch(
+            s_vals, coeffs, K=K, num_threads=2
+        )
+        for s, value in zip(s_vals, result):
+            assert value == func(s, coeffs), (K, s)
+
+
+def main():
+    if not c_de_casteljau.is_available():
+        print("C library is not available; checking the fallback only.")
+    else:
+        verify_private()
+    verify_empty()
+    verify_values()
+    print("All checks passed.")
+
+
+if __name__ == "__main__":
+    main()
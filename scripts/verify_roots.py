@@ -0,0 +1,121 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Verify the roots found by ``roots.find_roots``.
+
+Each polynomial is built from its (exact) roots, converted to the
+Bernstein basis with exact arithmetic and then rounded to float. Every
+simple root that is found must be within one ulp of a root of the
+rounded polynomial, i.e. the polynomial must change sign (or vanish)
+between the floats on either side of it. This is checked with exact
+(dyadic) evaluation.
+"""
+
+import fractions
+import math
+
+import dyadic
+import roots
+
+
+F = fractions.Fraction
+SIMPLE_CASES = (
+    # NOTE: On subdivision at ``1/2``, the coefficient at the midpoint
+    #       ``0.625`` rounds to exactly zero, though ``0.625`` is not a
+    #       root of the rounded polynomial.
+    ("0.207", "0.556", "0.625", "0.687", "0.896", "0.954"),
+    ("0.3", "0.8"),
+    ("0.8",),
+    (F(2, 11),),
+    (F(2, 11), "0.5"),
+    (F(1, 7), F(1, 3), F(2, 3)),
+)
+CLUSTER_CASES = (
+    (("0.25", "0.5", "0.5", "0.5"), ((0.25, 1), (0.5, 3))),
+    (("0.375", "0.375", "0.375", "0.375"), ((0.375, 4),)),
+)
+
+
+def binomial(n, k):
+    result = 1
+    for i in range(1, k + 1):
+        result = result * (n - k + i) // i
+    return result
+
+
+def bernstein_coeffs(exact_roots):
+    """Get the (rounded) Bernstein coefficients of a monic polynomial."""
+    # Expand ``(s - r_1) ... (s - r_n)`` in the monomial basis (with the
+    # coefficient of ``s^i`` at index ``i``).
+    monomial = [F(1)]
+    for root in exact_roots:
+        root = F(root)
+        expanded = [F(0)] * (len(monomial) + 1)
+        for i, coeff in enumerate(monomial):
+            expanded[i + 1] += coeff
+            expanded[i] -= root * coeff
+        monomial = expanded
+
+    degree = len(monomial) - 1
+    return [
+        float(
+            sum(
+                F(binomial(j, i), binomial(degree, i)) * monomial[i]
+                for i in range(j + 1)
+            )
+        )
+        for j in range(degree + 1)
+    ]
+
+
+def exact_sign(coeffs, s):
+    mantissa, _ = dyadic.de_casteljau(s, coeffs)
+    return (mantissa > 0) - (mantissa < 0)
+
+
+def neighbors(value):
+    """Get the floats on either side of a positive ``value``."""
+    mantissa, exponent = math.frexp(value)
+    ulp = math.ldexp(1.0, exponent - 53)
+    if mantissa == 0.5:
+        return value - 0.5 * ulp, value + ulp
+    return value - ulp, value + ulp
+
+
+def verify_simple(exact_roots):
+    coeffs = bernstein_coeffs(exact_roots)
+    found = roots.find_roots(coeffs)
+    assert len(found) == len(exact_roots), (exact_roots, found)
+    for root, multiplicity in found:
+        assert multiplicity == 1, (exact_roots, found)
+        below, above = neighbors(root)
+        sign_below = exact_sign(coeffs, below)
+        sign_above = exact_sign(coeffs, above)
+        assert sign_below * sign_above <= 0, (exact_roots, root)
+
+
+def verify_cluster(exact_roots, expected):
+    coeffs = bernstein_coeffs(exact_roots)
+    found = roots.find_roots(coeffs)
+    assert found == list(expected), (exact_roots, found)
+
+
+def main():
+    for exact_roots in SIMPLE_CASES:
+        verify_simple(exact_roots)
+    for exact_roots, expected in CLUSTER_CASES:
+        verify_cluster(exact_roots, expected)
+    print("All checks passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,7 @@ in the table are correct.
 
 import fractions
 
+import dyadic
 import eft
 
 
@@ -32,17 +33,11 @@ R_HAT, RHO = eft.add_eft(1.0, -S)
 
 
 def exact_de_castlejau(b4_vals):
-    b = {}
-    b[4] = tuple(map(F, b4_vals))
-    s = F(S)
-
-    for k in (3, 2, 1, 0):
-        prev_b = b[k + 1]
-        b[k] = tuple(
-            (1 - s) * b1 + s * b2 for b1, b2 in zip(prev_b, prev_b[1:])
-        )
-
-    return b
+    levels = dyadic.triangle(S, b4_vals)
+    return {
+        4 - k: tuple(map(dyadic.to_fraction, level))
+        for k, level in enumerate(levels)
+    }
 
 
 def stage1(b4_vals, exact_b):
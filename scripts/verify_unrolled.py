@@ -0,0 +1,72 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Verify the generated kernels in ``unrolled``.
+
+For several degrees and values of ``K``, this checks that each kernel
+from ``unrolled.get_kernel()`` produces the same ``K`` components as
+``de_casteljau._compensated_k`` and that ``unrolled.compensated()``
+matches ``de_casteljau.compensated`` (or ``compensated3``, etc.)
+bit-for-bit.
+"""
+
+import random
+
+import de_casteljau
+import eft
+import unrolled
+
+
+SEED = 1414
+DEGREES = (0, 1, 2, 3, 4, 7, 12)
+K_VALUES = (2, 3, 4, 5, 6)
+NUM_POINTS = 200
+COMPENSATED = {
+    2: de_casteljau.compensated,
+    3: de_casteljau.compensated3,
+    4: de_casteljau.compensated4,
+    5: de_casteljau.compensated5,
+}
+
+
+def expected_value(s, coeffs, K):
+    func = COMPENSATED.get(K)
+    if func is None:
+        return eft.sum_k(de_casteljau._compensated_k(s, coeffs, K), K)
+    return func(s, coeffs)
+
+
+def verify(degree, K, rand_gen):
+    coeffs = tuple(rand_gen.uniform(-1.0, 1.0) for _ in range(degree + 1))
+    kernel = unrolled.get_kernel(degree, K)
+    # NOTE: The endpoints and points close to them (where ``1 - s`` is
+    #       computed with little or no round-off) are also included.
+    s_vals = [rand_gen.random() for _ in range(NUM_POINTS)]
+    s_vals.extend((0.0, 1.0, 0.5, 0.5 + 0.5 ** 30, 1.0 - 0.5 ** 40))
+    for s in s_vals:
+        terms = kernel(s, coeffs)
+        expected = de_casteljau._compensated_k(s, coeffs, K)
+        assert terms == expected, (degree, K, s)
+        value = unrolled.compensated(s, coeffs, K=K)
+        assert value == expected_value(s, coeffs, K), (degree, K, s)
+
+
+def main():
+    rand_gen = random.Random(SEED)
+    for degree in DEGREES:
+        for K in K_VALUES:
+            verify(degree, K, rand_gen)
+    print("All checks passed.")
+
+
+if __name__ == "__main__":
+    main()
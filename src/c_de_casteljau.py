@@ -0,0 +1,375 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Binding to the C implementation of de Casteljau's method.
+
+``src/de_casteljau.c`` and ``src/eft.c`` are compiled (on first use)
+into a shared library and loaded via :mod:`ctypes`. The library is
+cached in a per-user directory (``$XDG_CACHE_HOME/de_casteljau`` or
+``~/.cache/de_casteljau``) that only the current user can write to. If
+that directory can't be used, the library is built in a new private
+temporary directory instead. NumPy arrays are
+passed to the batch functions ``basic_batch()`` and
+``compensated_batch()`` without copying, and large batches are split
+into chunks that run on a thread pool. Since :mod:`ctypes` releases the
+GIL while a foreign function runs, the chunks are evaluated in
+parallel.
+
+If no C compiler is available (or the build fails), the vectorized
+pure Python functions :func:`de_casteljau.basic_many` and
+:func:`de_casteljau.compensated_many` are used instead. In either case,
+the results match the scalar Python functions bit-for-bit.
+
+.. note::
+
+   The library is compiled with ``-ffp-contract=off`` so that the
+   compiler can't introduce FMAs (which would change the results). It is
+   compiled **without** OpenMP (so the ``omp`` pragmas in the batch
+   functions are ignored), since the chunks are already spread across
+   threads here.
+"""
+
+import atexit
+import concurrent.futures
+import ctypes
+import hashlib
+import os
+import shutil
+import stat
+import subprocess
+import tempfile
+
+import de_casteljau
+import eft
+
+try:
+    import numpy as np
+except ImportError:  # pragma: NO COVER
+    np = None
+
+
+_SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+_SOURCES = ("de_casteljau.c", "eft.c")
+_COMPILE_FLAGS = ("-std=c99", "-O3", "-shared", "-fPIC", "-ffp-contract=off")
+_LIBRARY_NAME = "libde_casteljau.so"
+# NOTE: Batches are only split into chunks of at least this many points,
+#       since each chunk has a (small) fixed cost.
+_MIN_CHUNK_SIZE = 4096
+# NOTE: ``_LIBRARY`` is ``None`` before the first load attempt and
+#       ``False`` if the library could not be built or loaded.
+_LIBRARY = None
+
+
+def _find_compiler():
+    compiler = os.environ.get("CC")
+    if compiler:
+        return compiler
+
+    for name in ("gcc", "cc", "clang"):
+        path = shutil.which(name)
+        if path is not None:
+            return path
+
+    return None
+
+
+def _cache_dir():
+    """The per-user directory where compiled libraries are cached."""
+    root = os.environ.get("XDG_CACHE_HOME")
+    if not root:
+        root = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(root, "de_casteljau")
+
+
+def _is_private(path):
+    """Check that only the current user can modify ``path``.
+
+    I.e. ``path`` exists, is owned by the current user and is neither
+    group nor world writable.
+    """
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return False
+
+    if stat_result.st_uid != os.getuid():
+        return False
+    return not stat_result.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _make_private_dir(path):
+    # Helper for ``build_library``.
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+    except OSError:
+        return False
+
+    return _is_private(path)
+
+
+def _library_path():
+    """The location of the compiled library (in the cache directory).
+
+    The directory name depends on the contents of the sources and the
+    compiler flags, so that a stale build is never used.
+    """
+    digest = hashlib.sha256()
+    for name in _SOURCES + ("de_casteljau.h", "eft.h"):
+        with open(os.path.join(_SRC_DIR, name), "rb") as file_obj:
+            digest.update(file_obj.read())
+    digest.update(" ".join(_COMPILE_FLAGS).encode("ascii"))
+
+    dirname = os.path.join(_cache_dir(), digest.hexdigest()[:16])
+    return os.path.join(dirname, _LIBRARY_NAME)
+
+
+def build_library(force=False):
+    """Compile the C sources into a shared library.
+
+    Args:
+        force (Optional[bool]): Indicates if the library should be
+            re-compiled even if it already exists. Defaults to
+            :data:`False`.
+
+    Returns:
+        Optional[str]: The path to the shared library, or :data:`None`
+        if there is no C compiler or compilation fails.
+    """
+    path = _library_path()
+    dirname = os.path.dirname(path)
+    # NOTE: Never build into (or load from) a directory that another user
+    #       could write to, e.g. a shared ``/tmp``. If the cache directory
+    #       can't be created (or is not private), a new private temporary
+    #       directory is used for this process.
+    if _make_private_dir(_cache_dir()) and _make_private_dir(dirname):
+        if _is_private(path) and not force:
+            return path
+    else:
+        dirname = tempfile.mkdtemp(prefix="de_casteljau-")
+        atexit.register(shutil.rmtree, dirname, True)
+        path = os.path.join(dirname, _LIBRARY_NAME)
+
+    compiler = _find_compiler()
+    if compiler is None:
+        return None
+
+    # NOTE: Compile to a temporary file (then rename) so that concurrent
+    #       builds never see a partially written library.
+    fd, tmp_path = tempfile.mkstemp(suffix=".so", dir=dirname)
+    os.close(fd)
+    sources = [os.path.join(_SRC_DIR, name) for name in _SOURCES]
+    command = (
+        [compiler]
+        + list(_COMPILE_FLAGS)
+        + ["-o", tmp_path]
+        + sources
+        + ["-I", _SRC_DIR, "-lm"]
+    )
+    try:
+        subprocess.check_call(
+            command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+    except (OSError, subprocess.CalledProcessError):
+        os.remove(tmp_path)
+        return None
+
+    # NOTE: The linker may re-create the output with a mode based on the
+    #       ``umask`` (which could allow group writes).
+    os.chmod(tmp_path, 0o700)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _load_library():
+    """Load the shared library (building it if needed).
+
+    Returns:
+        Optional[ctypes.CDLL]: The library, or :data:`None` if it could
+        not be built or loaded (or if NumPy is not installed).
+    """
+    global _LIBRARY
+
+    if _LIBRARY is None:
+        _LIBRARY = False
+        path = None if np is None else build_library()
+        if path is not None:
+            library = None
+            if _is_private(os.path.dirname(path)) and _is_private(path):
+                try:
+                    library = ctypes.CDLL(path)
+                except OSError:
+                    pass
+
+            if library is not None:
+                _set_signatures(library)
+                _LIBRARY = library
+
+    return _LIBRARY or None
+
+
+def _set_signatures(library):
+    # Helper for ``_load_library``.
+    in_array = np.ctypeslib.ndpointer(dtype=np.float64, flags="C_CONTIGUOUS")
+    out_array = np.ctypeslib.ndpointer(
+        dtype=np.float64, flags=("C_CONTIGUOUS", "WRITEABLE")
+    )
+    size_t = ctypes.c_size_t
+
+    library.basic_batch.argtypes = (
+        in_array,
+        size_t,
+        in_array,
+        size_t,
+        out_array,
+    )
+    library.basic_batch.restype = ctypes.c_int
+    library.compensated_batch.argtypes = (
+        in_array,
+        size_t,
+        in_array,
+        size_t,
+        size_t,
+        out_array,
+    )
+    library.compensated_batch.restype = ctypes.c_int
+
+
+def is_available():
+    """Check if the C library can be used.
+
+    Returns:
+        bool: Indicates if the library was built and loaded.
+    """
+    return _load_library() is not None
+
+
+def _chunk_bounds(num_points, num_threads):
+    # Helper for ``_run_chunks``.
+    if num_points == 0:
+        return []
+
+    num_chunks = min(num_threads, -(-num_points // _MIN_CHUNK_SIZE))
+    num_chunks = max(num_chunks, 1)
+    chunk_size = -(-num_points // num_chunks)
+    return [
+        (start, min(start + chunk_size, num_points))
+        for start in range(0, num_points, chunk_size)
+    ]
+
+
+def _run_chunks(func, s_flat, result, extra_args, num_threads):
+    """Run a batch function over chunks of points on a thread pool.
+
+    Each chunk is a view into ``s_flat`` and (the rows of) ``result``,
+    i.e. no copies are made. Since :mod:`ctypes` releases the GIL during
+    the call, the chunks run in parallel.
+    """
+    if num_threads is None:
+        num_threads = os.cpu_count() or 1
+
+    def run_chunk(bounds):
+        start, stop = bounds
+        status = func(
+            s_flat[start:stop], stop - start, *extra_args, result[start:stop]
+        )
+        if status != 0:
+            raise MemoryError("Failed to allocate a workspace")
+
+    chunks = _chunk_bounds(s_flat.size, num_threads)
+    if not chunks:
+        return
+    if len(chunks) == 1:
+        run_chunk(chunks[0])
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(len(chunks)) as executor:
+        # NOTE: ``list()`` ensures any exception is raised here.
+        list(executor.map(run_chunk, chunks))
+
+
+def basic_batch(s_vals, coeffs, num_threads=None):
+    """Performs the "standard" de Casteljau algorithm at many points.
+
+    Uses ``basic_batch()`` from the C library, falling back to
+    :func:`de_casteljau.basic_many` when it is not available.
+
+    Args:
+        s_vals (numpy.ndarray): The points to evaluate at (any shape).
+        coeffs (Sequence[float]): The Bernstein coefficients.
+        num_threads (Optional[int]): The maximum number of threads to
+            use. Defaults to the number of CPUs.
+
+    Returns:
+        numpy.ndarray: The evaluated values, with the same shape as
+        ``s_vals``.
+    """
+    library = _load_library()
+    if library is None:
+        return de_casteljau.basic_many(s_vals, coeffs)
+
+    s_vals = np.ascontiguousarray(s_vals, dtype=np.float64)
+    coeffs = np.ascontiguousarray(coeffs, dtype=np.float64)
+    s_flat = s_vals.reshape(-1)
+    result = np.empty(s_flat.shape)
+    degree = coeffs.size - 1
+    _run_chunks(
+        library.basic_batch, s_flat, result, (coeffs, degree), num_threads
+    )
+
+    return result.reshape(s_vals.shape)
+
+
+def compensated_batch(s_vals, coeffs, K=2, num_threads=None):
+    """Performs ``K``-compensated de Casteljau at many points.
+
+    Uses ``compensated_batch()`` from the C library (to compute the
+    ``K`` components for each point) and then :func:`eft.sum_k_array`,
+    falling back to :func:`de_casteljau.compensated_many` when the
+    library is not available.
+
+    Args:
+        s_vals (numpy.ndarray): The points to evaluate at (any shape).
+        coeffs (Sequence[float]): The Bernstein coefficients.
+        K (Optional[int]): The number of compensation levels (must be at
+            least 2). Defaults to ``2``.
+        num_threads (Optional[int]): The maximum number of threads to
+            use. Defaults to the number of CPUs.
+
+    Returns:
+        numpy.ndarray: The evaluated values, with the same shape as
+        ``s_vals``.
+
+    Raises:
+        ValueError: If ``K`` is less than 2.
+    """
+    if K < 2:
+        raise ValueError("K must be at least 2", K)
+
+    library = _load_library()
+    if library is None:
+        return de_casteljau.compensated_many(s_vals, coeffs, K=K)
+
+    s_vals = np.ascontiguousarray(s_vals, dtype=np.float64)
+    coeffs = np.ascontiguousarray(coeffs, dtype=np.float64)
+    s_flat = s_vals.reshape(-1)
+    components = np.empty((s_flat.size, K))
+    degree = coeffs.size - 1
+    _run_chunks(
+        library.compensated_batch,
+        s_flat,
+        components,
+        (coeffs, degree, K),
+        num_threads,
+    )
+
+    result = eft.sum_k_array(components.T, K)
+    return result.reshape(s_vals.shape)
@@ -10,8 +10,12 @@
 // See the License for the specific language governing permissions and
 // limitations under the License.
 
+#include "de_casteljau.h"
 #include "eft.h"
+#include <math.h>
 #include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
 
 double basic(double s, const double* coeffs, double* pk, size_t degree)
 {
@@ -123,3 +127,283 @@ void compensated(double s, const double* coeffs, size_t degree, size_t K,
         result[F] = bk[(degree + 1) * F];
     }
 }
+
+int basic_batch(const double* s_vals, size_t num_points, const double* coeffs,
+    size_t degree, double* result)
+{
+    // NOTE: This assumes that ``length(coeffs) == degree + 1``.
+    // NOTE: This requires ``length(s_vals) >= num_points`` and
+    //       ``length(result) >= num_points``.
+    // NOTE: Points are split across threads (when compiled with OpenMP)
+    //       and each thread allocates its own workspace. The return value
+    //       is ``0`` on success and ``-1`` if a workspace can't be
+    //       allocated.
+    int status = 0;
+
+#pragma omp parallel
+    {
+        double* pk = malloc((degree + 1) * sizeof(double));
+        if (pk == NULL) {
+#pragma omp atomic write
+            status = -1;
+        }
+
+        // NOTE: Every thread must reach the ``omp for`` (even if its
+        //       allocation failed).
+#pragma omp for schedule(static)
+        for (size_t i = 0; i < num_points; ++i) {
+            if (pk != NULL) {
+                result[i] = basic(s_vals[i], coeffs, pk, degree);
+            }
+        }
+
+        free(pk);
+    }
+
+    return status;
+}
+
+int compensated_batch(const double* s_vals, size_t num_points,
+    const double* coeffs, size_t degree, size_t K, double* result)
+{
+    // NOTE: This function **assumes** ``K >= 2`` and ``degree >= 0``.
+    // NOTE: This requires ``length(s_vals) >= num_points``.
+    // NOTE: This requires ``length(result) >= K num_points``; the ``K``
+    //       components for point ``i`` are ``result[K i], ...,
+    //       result[K i + K - 1]``.
+    // NOTE: Points are split across threads (when compiled with OpenMP)
+    //       and each thread allocates its own workspaces. The return value
+    //       is ``0`` on success and ``-1`` if a workspace can't be
+    //       allocated.
+    int status = 0;
+
+#pragma omp parallel
+    {
+        double* errors = malloc((5 * K - 7) * sizeof(double));
+        double* bk = malloc(K * (degree + 1) * sizeof(double));
+        int allocated = errors != NULL && bk != NULL;
+        if (!allocated) {
+#pragma omp atomic write
+            status = -1;
+        }
+
+        // NOTE: Every thread must reach the ``omp for`` (even if its
+        //       allocation failed).
+#pragma omp for schedule(static)
+        for (size_t i = 0; i < num_points; ++i) {
+            if (allocated) {
+                compensated(
+                    s_vals[i], coeffs, degree, K, errors, bk, &result[K * i]);
+            }
+        }
+
+        free(errors);
+        free(bk);
+    }
+
+    return status;
+}
+
+// NOTE: The ``*_block()`` helpers below operate on rows of
+//       ``DE_CASTELJAU_BLOCK_WIDTH`` lanes (i.e. a structure-of-arrays
+//       layout). Each is a loop over lanes with no dependencies between
+//       iterations, so that the compiler can auto-vectorize it.
+
+static inline void two_prod_block(const double* restrict val1,
+    const double* restrict val2, double* restrict product,
+    double* restrict error)
+{
+    for (size_t lane = 0; lane < DE_CASTELJAU_BLOCK_WIDTH; ++lane) {
+        product[lane] = val1[lane] * val2[lane];
+        error[lane] = fma(val1[lane], val2[lane], -product[lane]);
+    }
+}
+
+static inline void two_sum_block(const double* restrict val1,
+    const double* restrict val2, double* restrict sum, double* restrict error)
+{
+    for (size_t lane = 0; lane < DE_CASTELJAU_BLOCK_WIDTH; ++lane) {
+        sum[lane] = val1[lane] + val2[lane];
+        double almost_val2 = sum[lane] - val1[lane];
+        error[lane] = (val1[lane] - (sum[lane] - almost_val2))
+            + (val2[lane] - almost_val2);
+    }
+}
+
+static void local_error_block(const double* errors, size_t num_errs,
+    const double* rho, const double* delta_b, double* l_hat)
+{
+    // NOTE: This **assumes** ``errors`` has (at least) ``num_errs`` rows
+    //       and that ``num_errs >= 1``.
+    for (size_t lane = 0; lane < DE_CASTELJAU_BLOCK_WIDTH; ++lane) {
+        l_hat[lane] = errors[lane];
+    }
+    for (size_t j = 1; j < num_errs; ++j) {
+        for (size_t lane = 0; lane < DE_CASTELJAU_BLOCK_WIDTH; ++lane) {
+            l_hat[lane] += errors[DE_CASTELJAU_BLOCK_WIDTH * j + lane];
+        }
+    }
+    for (size_t lane = 0; lane < DE_CASTELJAU_BLOCK_WIDTH; ++lane) {
+        l_hat[lane] += rho[lane] * delta_b[lane];
+    }
+}
+
+static void local_error_eft_block(double* errors, size_t num_errs,
+    const double* rho, const double* delta_b, double* result)
+{
+    // NOTE: This **assumes** ``errors`` has (at least) ``num_errs + 1`` rows
+    //       and that ``num_errs >= 2``.
+    double buffer1[DE_CASTELJAU_BLOCK_WIDTH];
+    double buffer2[DE_CASTELJAU_BLOCK_WIDTH];
+    double prod[DE_CASTELJAU_BLOCK_WIDTH];
+    double* l_hat = buffer1;
+    double* tmp = buffer2;
+
+    two_sum_block(&errors[0], &errors[DE_CASTELJAU_BLOCK_WIDTH], l_hat, tmp);
+    memcpy(&errors[0], tmp, DE_CASTELJAU_BLOCK_WIDTH * sizeof(double));
+    for (size_t j = 2; j < num_errs; ++j) {
+        two_sum_block(l_hat, &errors[DE_CASTELJAU_BLOCK_WIDTH * j], tmp,
+            &errors[DE_CASTELJAU_BLOCK_WIDTH * (j - 1)]);
+        double* swap = l_hat;
+        l_hat = tmp;
+        tmp = swap;
+    }
+
+    two_prod_block(rho, delta_b, prod,
+        &errors[DE_CASTELJAU_BLOCK_WIDTH * (num_errs - 1)]);
+    two_sum_block(
+        l_hat, prod, result, &errors[DE_CASTELJAU_BLOCK_WIDTH * num_errs]);
+}
+
+void compensated_block(const double* s, const double* coeffs, size_t degree,
+    size_t K, double* errors, double* bk, double* result)
+{
+    // NOTE: This is ``compensated()`` for ``DE_CASTELJAU_BLOCK_WIDTH``
+    //       points at once; the operations for each lane are exactly the
+    //       same. Below, ``W`` is short for ``DE_CASTELJAU_BLOCK_WIDTH``.
+    // NOTE: This function **assumes** ``K >= 2`` and ``degree >= 0``.
+    // NOTE: This requires ``length(s) >= W``.
+    // NOTE: This requires ``length(errors) >= (5K - 7) W``.
+    // NOTE: This requires ``length(bk) >= K(degree + 1) W``.
+    // NOTE: This requires ``length(result) >= K W``; component ``F`` for
+    //       lane ``i`` is ``result[F W + i]``.
+    double r[DE_CASTELJAU_BLOCK_WIDTH], rho[DE_CASTELJAU_BLOCK_WIDTH];
+    double neg_s[DE_CASTELJAU_BLOCK_WIDTH], one[DE_CASTELJAU_BLOCK_WIDTH];
+    double delta_b[DE_CASTELJAU_BLOCK_WIDTH];
+    double val1[DE_CASTELJAU_BLOCK_WIDTH], val2[DE_CASTELJAU_BLOCK_WIDTH];
+    double val3[DE_CASTELJAU_BLOCK_WIDTH];
+
+    for (size_t lane = 0; lane < DE_CASTELJAU_BLOCK_WIDTH; ++lane) {
+        one[lane] = 1.0;
+        neg_s[lane] = -s[lane];
+    }
+    two_sum_block(one, neg_s, r, rho);
+
+    // Initialize ``bk`` (everything after ``F = 0`` is zero).
+    for (size_t j = 0; j <= degree; ++j) {
+        for (size_t lane = 0; lane < DE_CASTELJAU_BLOCK_WIDTH; ++lane) {
+            bk[DE_CASTELJAU_BLOCK_WIDTH * j + lane] = coeffs[j];
+        }
+    }
+    for (size_t j = degree + 1; j < K * (degree + 1); ++j) {
+        for (size_t lane = 0; lane < DE_CASTELJAU_BLOCK_WIDTH; ++lane) {
+            bk[DE_CASTELJAU_BLOCK_WIDTH * j + lane] = 0.0;
+        }
+    }
+
+    for (size_t k = 0; k < degree; ++k) {
+        for (size_t j = 0; j < degree - k; ++j) {
+            double* bk_j = &bk[DE_CASTELJAU_BLOCK_WIDTH * j];
+            memcpy(delta_b, bk_j, DE_CASTELJAU_BLOCK_WIDTH * sizeof(double));
+
+            // Update the "level 0" stuff.
+            two_prod_block(r, bk_j, val1, &errors[0]);
+            two_prod_block(s, bk_j + DE_CASTELJAU_BLOCK_WIDTH, val2,
+                &errors[DE_CASTELJAU_BLOCK_WIDTH]);
+            two_sum_block(
+                val1, val2, bk_j, &errors[2 * DE_CASTELJAU_BLOCK_WIDTH]);
+
+            size_t num_errs = 3;
+            size_t index_shift = degree + 1;
+            for (size_t F = 1; F < K - 1; ++F) {
+                local_error_eft_block(errors, num_errs, rho, delta_b, val1);
+                bk_j = &bk[DE_CASTELJAU_BLOCK_WIDTH * (index_shift + j)];
+                memcpy(delta_b, bk_j,
+                    DE_CASTELJAU_BLOCK_WIDTH * sizeof(double));
+
+                two_prod_block(s, bk_j + DE_CASTELJAU_BLOCK_WIDTH, val2,
+                    &errors[DE_CASTELJAU_BLOCK_WIDTH * (num_errs + 1)]);
+                two_sum_block(val1, val2, val3,
+                    &errors[DE_CASTELJAU_BLOCK_WIDTH * (num_errs + 2)]);
+                two_prod_block(r, bk_j, val2,
+                    &errors[DE_CASTELJAU_BLOCK_WIDTH * (num_errs + 3)]);
+                two_sum_block(val3, val2, bk_j,
+                    &errors[DE_CASTELJAU_BLOCK_WIDTH * (num_errs + 4)]);
+
+                num_errs += 5;
+                // Update the index shift for the next iteration.
+                index_shift += degree + 1;
+            }
+
+            // Update the "level 2" stuff.
+            local_error_block(errors, num_errs, rho, delta_b, val1);
+            bk_j = &bk[DE_CASTELJAU_BLOCK_WIDTH * (index_shift + j)];
+            for (size_t lane = 0; lane < DE_CASTELJAU_BLOCK_WIDTH; ++lane) {
+                bk_j[lane] = val1[lane]
+                    + s[lane] * bk_j[DE_CASTELJAU_BLOCK_WIDTH + lane]
+                    + r[lane] * bk_j[lane];
+            }
+        }
+    }
+
+    for (size_t F = 0; F < K; ++F) {
+        memcpy(&result[DE_CASTELJAU_BLOCK_WIDTH * F],
+            &bk[DE_CASTELJAU_BLOCK_WIDTH * (degree + 1) * F],
+            DE_CASTELJAU_BLOCK_WIDTH * sizeof(double));
+    }
+}
+
+int compensated_block_batch(const double* s_vals, size_t num_points,
+    const double* coeffs, size_t degree, size_t K, double* result)
+{
+    // NOTE: This has the same inputs and outputs as ``compensated_batch()``
+    //       but points are processed ``DE_CASTELJAU_BLOCK_WIDTH`` at a time
+    //       via ``compensated_block()``. The last (partial) block is padded.
+    // NOTE: This function **assumes** ``K >= 2`` and ``degree >= 0``.
+    const size_t row_size = DE_CASTELJAU_BLOCK_WIDTH * sizeof(double);
+    double* errors = malloc((5 * K - 7) * row_size);
+    double* bk = malloc(K * (degree + 1) * row_size);
+    double* block_result = malloc(K * row_size);
+    if (errors == NULL || bk == NULL || block_result == NULL) {
+        free(errors);
+        free(bk);
+        free(block_result);
+        return -1;
+    }
+
+    double s_block[DE_CASTELJAU_BLOCK_WIDTH];
+    for (size_t start = 0; start < num_points;
+         start += DE_CASTELJAU_BLOCK_WIDTH) {
+        size_t num_lanes = num_points - start;
+        if (num_lanes > DE_CASTELJAU_BLOCK_WIDTH) {
+            num_lanes = DE_CASTELJAU_BLOCK_WIDTH;
+        }
+        for (size_t lane = 0; lane < DE_CASTELJAU_BLOCK_WIDTH; ++lane) {
+            s_block[lane] = lane < num_lanes ? s_vals[start + lane] : 0.0;
+        }
+
+        compensated_block(
+            s_block, coeffs, degree, K, errors, bk, block_result);
+        for (size_t lane = 0; lane < num_lanes; ++lane) {
+            for (size_t F = 0; F < K; ++F) {
+                result[K * (start + lane) + F]
+                    = block_result[DE_CASTELJAU_BLOCK_WIDTH * F + lane];
+            }
+        }
+    }
+
+    free(errors);
+    free(bk);
+    free(block_result);
+    return 0;
+}
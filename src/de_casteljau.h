@@ -15,6 +15,10 @@
 
 #include <stdio.h>
 
+// NOTE: The number of points (lanes) processed together by
+//       ``compensated_block()``.
+#define DE_CASTELJAU_BLOCK_WIDTH 8
+
 #if defined(__cplusplus)
 extern "C" {
 #endif
@@ -22,6 +26,14 @@ extern "C" {
 double basic(double s, const double* coeffs, double* pk, size_t degree);
 void compensated(double s, const double* coeffs, size_t degree, size_t K,
     double* errors, double* bk, double* result);
+int basic_batch(const double* s_vals, size_t num_points, const double* coeffs,
+    size_t degree, double* result);
+int compensated_batch(const double* s_vals, size_t num_points,
+    const double* coeffs, size_t degree, size_t K, double* result);
+void compensated_block(const double* s, const double* coeffs, size_t degree,
+    size_t K, double* errors, double* bk, double* result);
+int compensated_block_batch(const double* s_vals, size_t num_points,
+    const double* coeffs, size_t degree, size_t K, double* result);
 
 #if defined(__cplusplus)
 }
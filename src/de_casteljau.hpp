@@ -15,6 +15,7 @@
 
 #include "eft.hpp"
 #include <array>
+#include <cmath>
 #include <tuple>
 #include <vector>
 
@@ -92,6 +93,144 @@ std::array<double, K> compensated(
     }
     return b_hat;
 }
+
+// NOTE: The ``*_block()`` functions below operate on rows of ``W`` lanes
+//       (i.e. a structure-of-arrays layout). Each is a loop over lanes
+//       with no dependencies between iterations, so that the compiler can
+//       auto-vectorize it.
+template <size_t W> using Lanes = std::array<double, W>;
+
+template <size_t W>
+inline void two_prod_block(const Lanes<W>& val1, const Lanes<W>& val2,
+    Lanes<W>& product, Lanes<W>& error)
+{
+    for (size_t lane = 0; lane < W; ++lane) {
+        product[lane] = val1[lane] * val2[lane];
+        error[lane] = std::fma(val1[lane], val2[lane], -product[lane]);
+    }
+}
+
+template <size_t W>
+inline void two_sum_block(const Lanes<W>& val1, const Lanes<W>& val2,
+    Lanes<W>& sum, Lanes<W>& error)
+{
+    for (size_t lane = 0; lane < W; ++lane) {
+        sum[lane] = val1[lane] + val2[lane];
+        double almost_val2 = sum[lane] - val1[lane];
+        error[lane] = (val1[lane] - (sum[lane] - almost_val2))
+            + (val2[lane] - almost_val2);
+    }
+}
+
+template <size_t W>
+Lanes<W> local_error_block(const Lanes<W>* errors, size_t num_errs,
+    const Lanes<W>& rho, const Lanes<W>& delta_b)
+{
+    // NOTE: This **assumes** ``errors`` has (at least) ``num_errs`` rows
+    //       and that ``num_errs >= 1``.
+    Lanes<W> l_hat = errors[0];
+    for (size_t j = 1; j < num_errs; ++j) {
+        for (size_t lane = 0; lane < W; ++lane) {
+            l_hat[lane] += errors[j][lane];
+        }
+    }
+    for (size_t lane = 0; lane < W; ++lane) {
+        l_hat[lane] += rho[lane] * delta_b[lane];
+    }
+
+    return l_hat;
+}
+
+template <size_t W>
+Lanes<W> local_error_eft_block(Lanes<W>* errors, size_t num_errs,
+    const Lanes<W>& rho, const Lanes<W>& delta_b)
+{
+    // NOTE: This **assumes** ``errors`` has (at least) ``num_errs + 1``
+    //       rows and that ``num_errs >= 2``.
+    Lanes<W> l_hat, tmp;
+    two_sum_block<W>(errors[0], errors[1], l_hat, tmp);
+    errors[0] = tmp;
+    for (size_t j = 2; j < num_errs; ++j) {
+        two_sum_block<W>(l_hat, errors[j], tmp, errors[j - 1]);
+        l_hat = tmp;
+    }
+
+    Lanes<W> prod;
+    two_prod_block<W>(rho, delta_b, prod, errors[num_errs - 1]);
+    two_sum_block<W>(l_hat, prod, tmp, errors[num_errs]);
+
+    return tmp;
+}
+
+template <size_t K, size_t degree, size_t W>
+std::array<Lanes<W>, K> compensated_block(
+    const Lanes<W>& s, const std::array<double, degree + 1>& coeffs)
+{
+    // NOTE: This is ``compensated<K, degree>()`` for ``W`` points at once;
+    //       the operations for each lane are exactly the same.
+    // NOTE: This function **assumes** ``K >= 2`` and ``degree >= 0``.
+    Lanes<W> one, neg_s, r, rho;
+    for (size_t lane = 0; lane < W; ++lane) {
+        one[lane] = 1.0;
+        neg_s[lane] = -s[lane];
+    }
+    two_sum_block<W>(one, neg_s, r, rho);
+
+    std::array<Lanes<W>, 5 * K - 7> errors;
+    std::array<Lanes<W>, (degree + 1)* K> bk = {}; // Zero-initialize.
+
+    // Initialize ``bk`` (everything after ``F = 0`` is zero).
+    for (size_t j = 0; j <= degree; ++j) {
+        bk[j].fill(coeffs[j]);
+    }
+
+    for (size_t k = 0; k < degree; ++k) {
+        for (size_t j = 0; j < degree - k; ++j) {
+            Lanes<W> delta_b = bk[j];
+
+            // Update the "level 0" stuff.
+            Lanes<W> val1, val2, val3;
+            two_prod_block<W>(r, bk[j], val1, errors[0]);
+            two_prod_block<W>(s, bk[j + 1], val2, errors[1]);
+            two_sum_block<W>(val1, val2, bk[j], errors[2]);
+
+            size_t num_errs = 3;
+            size_t index_shift = degree + 1;
+            for (size_t F = 1; F < K - 1; ++F) {
+                val1 = local_error_eft_block<W>(
+                    &errors[0], num_errs, rho, delta_b);
+                delta_b = bk[index_shift + j];
+
+                two_prod_block<W>(
+                    s, bk[index_shift + j + 1], val2, errors[num_errs + 1]);
+                two_sum_block<W>(val1, val2, val3, errors[num_errs + 2]);
+                two_prod_block<W>(
+                    r, bk[index_shift + j], val2, errors[num_errs + 3]);
+                two_sum_block<W>(
+                    val3, val2, bk[index_shift + j], errors[num_errs + 4]);
+
+                num_errs += 5;
+                // Update the index shift for the next iteration.
+                index_shift += degree + 1;
+            }
+
+            // Update the "level 2" stuff.
+            val1 = local_error_block<W>(&errors[0], num_errs, rho, delta_b);
+            Lanes<W>& b_next = bk[index_shift + j + 1];
+            Lanes<W>& b_curr = bk[index_shift + j];
+            for (size_t lane = 0; lane < W; ++lane) {
+                b_curr[lane] = val1[lane] + s[lane] * b_next[lane]
+                    + r[lane] * b_curr[lane];
+            }
+        }
+    }
+
+    std::array<Lanes<W>, K> b_hat;
+    for (size_t F = 0; F < K; ++F) {
+        b_hat[F] = bk[(degree + 1) * F];
+    }
+    return b_hat;
+}
 }
 
 #endif /* DE_CASTELJAU_HPP */
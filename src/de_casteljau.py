@@ -38,8 +38,20 @@ This module provides both the standard version and a compensated version.
 """
 
 
+import array
+import collections
+
 import eft
 
+try:
+    import numpy as np
+except ImportError:  # pragma: NO COVER
+    np = None
+
+
+_U = 0.5 ** 53
+_CURVE_CHUNK_VALUES = 4096
+
 
 def basic(s, coeffs):
     """Performs the "standard" de Casteljau algorithm."""
@@ -57,6 +69,50 @@ def basic(s, coeffs):
     return pk[0]
 
 
+def basic_many(s_vals, coeffs):
+    """Performs the "standard" de Casteljau algorithm at many points.
+
+    The whole triangle is computed one level at a time across all points
+    (i.e. "vectorized" in both ``j`` and ``s``) in a single workspace with
+    shape ``(2, degree + 1, num_points)``. The same operations as
+    :func:`basic` are performed, so the result matches it bit-for-bit.
+
+    Args:
+        s_vals (numpy.ndarray): The points to evaluate at (any shape).
+        coeffs (Sequence[float]): The Bernstein coefficients.
+
+    Returns:
+        numpy.ndarray: The evaluated values, with the same shape as
+        ``s_vals``.
+    """
+    s_vals = np.asarray(s_vals, dtype=np.float64)
+    s = s_vals.reshape(-1)
+    return _basic_array(s, 1.0 - s, coeffs).reshape(s_vals.shape)
+
+
+def _basic_array(s, r, coeffs):
+    r"""Performs the "standard" de Casteljau algorithm for flat arrays.
+
+    Helper for :func:`basic_many` and :func:`condition_number`. The
+    values ``r`` are passed in (rather than computed as ``1 - s``) so
+    that :math:`\widetilde{p}` can be evaluated with :math:`|s|` and
+    :math:`|1 - s|`.
+    """
+    degree = len(coeffs) - 1
+    workspace = np.empty((2, degree + 1, s.size))
+    pk, tmp = workspace
+    pk[:] = np.asarray(coeffs, dtype=np.float64)[:, np.newaxis]
+    for k in range(degree):
+        num_vals = degree - k
+        # NOTE: ``s * pk[j + 1]`` must be computed before ``pk[j]`` is
+        #       overwritten for ``j + 1``.
+        np.multiply(s, pk[1 : num_vals + 1], out=tmp[:num_vals])
+        np.multiply(r, pk[:num_vals], out=pk[:num_vals])
+        pk[:num_vals] += tmp[:num_vals]
+
+    return pk[0]
+
+
 def local_error(errors, rho, delta_b):
     r"""Compute :math:`\ell` from a list of errors.
 
@@ -93,7 +149,51 @@ def local_error_eft(errors, rho, delta_b):
     return new_errors, l_hat
 
 
-def _compensated_k(s, coeffs, K):
+def _local_error_bound(errors, rho, delta_b):
+    r"""Compute :math:`\ell` as in :func:`local_error` with a running sum.
+
+    The operations used to compute :math:`\widehat{\ell}` are exactly those
+    in :func:`local_error`. In addition, the absolute values of every
+    computed partial result are summed; since each of these operations
+    has a relative error at most :math:`\mathbf{u}` (of the computed
+    value), :math:`\mathbf{u}` times this sum bounds the round-off
+    error in :math:`\widehat{\ell}`.
+    """
+    num_errs = len(errors)
+
+    l_hat = errors[0] + errors[1]
+    abs_sum = abs(l_hat)
+    for j in range(2, num_errs):
+        l_hat += errors[j]
+        abs_sum += abs(l_hat)
+
+    prod = rho * delta_b
+    l_hat += prod
+    abs_sum += abs(prod) + abs(l_hat)
+
+    return l_hat, abs_sum
+
+
+def _top_level_bound(errors, rho, delta_b, s, r, b1, b0):
+    r"""Compute a node on the last level along with a local error bound.
+
+    The value matches the one computed (without EFTs) on the last level
+    of :func:`_compensated_k` bit-for-bit. The local error bound accounts
+    for the round-off in each operation as well as the term
+    :math:`\rho \cdot b_0` that is dropped since there is no further
+    level to account for it.
+    """
+    l_hat, abs_sum = _local_error_bound(errors, rho, delta_b)
+    P1 = s * b1
+    S2 = l_hat + P1
+    P3 = r * b0
+    value = S2 + P3
+    abs_sum += abs(P1) + abs(S2) + abs(P3) + abs(value)
+
+    return value, _U * abs_sum + abs(rho * b0)
+
+
+def _compensated_k(s, coeffs, K, with_bound=False):
     r"""Performs a K-compensated de Casteljau.
 
     .. _JLCS10: https://doi.org/10.1016/j.camwa.2010.05.021
@@ -123,6 +223,54 @@ def _compensated_k(s, coeffs, K):
 
     only has to be in one sum. We avoid an extra sum because
     :math:`\widehat{r}` already has round-off error.
+
+    If ``with_bound`` is :data:`True`, a rigorous (a posteriori) bound on
+    :math:`\left|p(s) - \sum_F \widehat{\partial^F b}\right|` is
+    computed in the same pass. The round-off from each operation on the
+    last level (the only level not computed with EFTs) is bounded via the
+    computed values and these local errors are propagated through the
+    (absolute value of the) de Casteljau recurrence. In this case, the
+    returned value is a pair of the ``K`` components and the bound. This
+    does not include the error from summing the components, see
+    :func:`compensated_with_bound`.
+
+    .. note::
+
+       The bound assumes that no underflow or overflow occurs.
+    """
+    degree = len(coeffs) - 1
+    levels = _compensated_k_levels(s, coeffs, K, with_bound=with_bound)
+    for bk, mu in levels:
+        pass
+
+    components = tuple(bk[F][0] for F in range(K - 1 + 1))
+    if with_bound:
+        return components, _triangle_bound(mu[0], K, degree)
+
+    return components
+
+
+def _compensated_k_levels(
+    s, coeffs, K, with_bound=False, coeff_errors=None
+):
+    """Generate each level of the triangle in :func:`_compensated_k`.
+
+    This is the "work" done by :func:`_compensated_k`, but every level
+    is yielded (starting with ``coeffs`` at level ``0``) so that callers
+    can also make use of the levels before the last one.
+
+    If ``coeff_errors`` is provided, it contains (at most ``K - 1``)
+    sequences that are used as the "level 0" values for
+    ``F = 1, 2, ...`` instead of zero. The recurrence for each ``F`` is
+    linear, so the triangle computed is the one for the (unevaluated) sum
+    of ``coeffs`` and ``coeff_errors`` (e.g. for the compensated control
+    points produced by :func:`subdivide`).
+
+    Yields:
+        Tuple[Dict[int, Sequence[float]], Optional[List[float]]]: The
+        values in the current level, keyed on ``F = 0, ..., K - 1``, and
+        the propagated (local) error bounds for each node in the level
+        (will be :data:`None` unless ``with_bound`` is :data:`True`).
     """
     r, rho = eft.add_eft(1.0, -s)
 
@@ -132,9 +280,21 @@ def _compensated_k(s, coeffs, K):
     all_zero = (0.0,) * (degree + 1)
     for F in range(1, K - 1 + 1):
         bk[F] = all_zero
+    if coeff_errors is not None:
+        for F, errors in enumerate(coeff_errors, start=1):
+            bk[F] = list(errors)
+
+    mu = None
+    if with_bound:
+        abs_s = abs(s)
+        abs_r = abs(r) + abs(rho)
+        mu = [0.0] * (degree + 1)
+
+    yield bk, mu
 
     for k in range(degree):
         new_bk = {F: [] for F in range(K - 1 + 1)}
+        new_mu = []
 
         for j in range(degree - k):
             # Update the "level 0" stuff.
@@ -159,32 +319,949 @@ def _compensated_k(s, coeffs, K):
                 delta_b = bk[F][j]
 
             # Update the "level 2" stuff.
+            if with_bound:
+                value, local_err = _top_level_bound(
+                    errors, rho, delta_b, s, r, bk[K - 1][j + 1], bk[K - 1][j]
+                )
+                new_bk[K - 1].append(value)
+                new_mu.append(local_err + abs_s * mu[j + 1] + abs_r * mu[j])
+            else:
+                l_hat = local_error(errors, rho, delta_b)
+                new_bk[K - 1].append(
+                    l_hat + s * bk[K - 1][j + 1] + r * bk[K - 1][j]
+                )
+
+        # Update the "current" values.
+        bk = new_bk
+        if with_bound:
+            mu = new_mu
+
+        yield bk, mu
+
+
+class Workspace(object):
+    """Reusable buffers for :func:`_compensated_k_workspace`.
+
+    The layout mirrors the caller-supplied buffers used by
+    ``compensated()`` in ``src/de_casteljau.c``: ``errors`` has length
+    ``5K - 7`` and ``bk`` stores each of the ``K`` levels (of length
+    ``degree + 1``) one after another.
+
+    Args:
+        degree (int): The degree of the polynomials to be evaluated.
+        K (int): The number of compensation levels (must be at least 2).
+    """
+
+    def __init__(self, degree, K):
+        if K < 2:
+            raise ValueError("K must be at least 2", K)
+
+        self.degree = degree
+        self.K = K
+        self.errors = array.array("d", [0.0]) * (5 * K - 7)
+        self.bk = array.array("d", [0.0]) * (K * (degree + 1))
+        self.result = array.array("d", [0.0]) * K
+
+
+def _local_error_inplace(errors, num_errs, rho, delta_b):
+    """In-place version of :func:`local_error`.
+
+    Only the first ``num_errs`` entries of ``errors`` are used.
+    """
+    l_hat = errors[0] + errors[1]
+    for j in range(2, num_errs):
+        l_hat += errors[j]
+
+    l_hat += rho * delta_b
+
+    return l_hat
+
+
+def _local_error_eft_inplace(errors, num_errs, rho, delta_b):
+    """In-place version of :func:`local_error_eft`.
+
+    The ``num_errs + 1`` new errors overwrite the start of ``errors``.
+    """
+    l_hat, errors[0] = eft.add_eft(errors[0], errors[1])
+    for j in range(2, num_errs):
+        l_hat, errors[j - 1] = eft.add_eft(l_hat, errors[j])
+
+    prod, errors[num_errs - 1] = eft.multiply_eft(rho, delta_b)
+    l_hat, errors[num_errs] = eft.add_eft(l_hat, prod)
+
+    return l_hat
+
+
+def _compensated_k_workspace(s, coeffs, workspace):
+    """Performs a K-compensated de Casteljau with preallocated buffers.
+
+    This is a port of ``compensated()`` in ``src/de_casteljau.c``: every
+    intermediate value is stored in ``workspace`` so repeated calls (with
+    the same degree and ``K``) do not allocate any lists. The order of
+    operations is the same as in :func:`_compensated_k`, so the result
+    matches it bit-for-bit.
+
+    Args:
+        s (float): The point to evaluate at.
+        coeffs (Sequence[float]): The Bernstein coefficients.
+        workspace (Workspace): The buffers to use.
+
+    Returns:
+        array.array: The ``K`` components (this is ``workspace.result``,
+        so it will be overwritten by the next call).
+
+    Raises:
+        ValueError: If the degree of ``coeffs`` doesn't match the
+            ``workspace``.
+    """
+    degree = workspace.degree
+    if len(coeffs) != degree + 1:
+        raise ValueError("Workspace has the wrong degree", degree, coeffs)
+
+    K = workspace.K
+    errors = workspace.errors
+    bk = workspace.bk
+    r, rho = eft.add_eft(1.0, -s)
+
+    # Initialize ``bk`` (everything after ``F = 0`` is zero).
+    for j in range(degree + 1):
+        bk[j] = coeffs[j]
+    for j in range(degree + 1, K * (degree + 1)):
+        bk[j] = 0.0
+
+    for k in range(degree):
+        for j in range(degree - k):
+            delta_b = bk[j]
+
+            # Update the "level 0" stuff.
+            P1, errors[0] = eft.multiply_eft(r, bk[j])
+            P2, errors[1] = eft.multiply_eft(s, bk[j + 1])
+            bk[j], errors[2] = eft.add_eft(P1, P2)
+
+            num_errs = 3
+            index_shift = degree + 1
+            for _ in range(1, K - 2 + 1):
+                l_hat = _local_error_eft_inplace(
+                    errors, num_errs, rho, delta_b
+                )
+                delta_b = bk[index_shift + j]
+
+                P1, errors[num_errs + 1] = eft.multiply_eft(
+                    s, bk[index_shift + j + 1]
+                )
+                S2, errors[num_errs + 2] = eft.add_eft(l_hat, P1)
+                P3, errors[num_errs + 3] = eft.multiply_eft(
+                    r, bk[index_shift + j]
+                )
+                bk[index_shift + j], errors[num_errs + 4] = eft.add_eft(
+                    S2, P3
+                )
+
+                num_errs += 5
+                # Update the index shift for the next iteration.
+                index_shift += degree + 1
+
+            # Update the "level 2" stuff.
+            l_hat = _local_error_inplace(errors, num_errs, rho, delta_b)
+            bk[index_shift + j] = (
+                l_hat + s * bk[index_shift + j + 1] + r * bk[index_shift + j]
+            )
+
+    result = workspace.result
+    for F in range(K):
+        result[F] = bk[(degree + 1) * F]
+
+    return result
+
+
+def _local_error_eft_array(errors, rho, delta_b, rho_split=None):
+    """Vectorized version of :func:`local_error_eft`."""
+    num_errs = len(errors)
+    new_errors = [None] * (num_errs + 1)
+
+    l_hat, new_errors[0] = eft.add_eft(errors[0], errors[1])
+    for j in range(2, num_errs):
+        l_hat, new_errors[j - 1] = eft.add_eft(l_hat, errors[j])
+
+    prod, new_errors[num_errs - 1] = eft.multiply_eft_array(
+        rho, delta_b, split1=rho_split
+    )
+    l_hat, new_errors[num_errs] = eft.add_eft(l_hat, prod)
+
+    return new_errors, l_hat
+
+
+def _compensated_k_array(s, coeffs, K, with_bound=False):
+    r"""Vectorized version of :func:`_compensated_k`.
+
+    Each level of the triangle is computed for every ``j`` at once and
+    across every point. The order of operations exactly matches
+    :func:`_compensated_k` (and the `JLCS10`_ paper), so each entry
+    matches it bit-for-bit.
+
+    Args:
+        s (numpy.ndarray): The point(s) to evaluate at.
+        coeffs (numpy.ndarray): The Bernstein coefficients, with shape
+            ``(degree + 1,) + shape`` where ``shape`` can be broadcast
+            against the shape of ``s``.
+        K (int): The number of compensation levels.
+        with_bound (Optional[bool]): Indicates if an error bound should
+            also be computed (as in :func:`_compensated_k`). Defaults to
+            :data:`False`.
+
+    Returns:
+        Tuple[numpy.ndarray, ...]: The ``K`` components
+        :math:`\widehat{b}, \widehat{\partial b}, \ldots`, each with the
+        (broadcast) shape of the evaluated points. If ``with_bound`` is
+        :data:`True`, this will be a pair of the components and the
+        (elementwise) bound on the error in their exact sum.
+    """
+    degree = np.shape(coeffs)[0] - 1
+    levels = _compensated_k_array_levels(s, coeffs, K, with_bound=with_bound)
+    for bk, mu in levels:
+        pass
+
+    components = tuple(bk[F][0] for F in range(K - 1 + 1))
+    if with_bound:
+        return components, _triangle_bound(mu[0], K, degree)
+
+    return components
+
+
+def _compensated_k_array_levels(
+    s, coeffs, K, with_bound=False, coeff_errors=None
+):
+    """Vectorized version of :func:`_compensated_k_levels`.
+
+    The arguments are the same as in :func:`_compensated_k_array` (and
+    each of ``coeff_errors`` has the same shape as ``coeffs``). Each
+    value in a yielded level is an array with shape
+    ``(num_vals,) + shape`` (where ``shape`` is the broadcast shape of
+    the evaluated points).
+    """
+    s = np.asarray(s, dtype=np.float64)
+    coeffs = np.asarray(coeffs, dtype=np.float64)
+    r, rho = eft.add_eft_array(1.0, -s)
+
+    degree = coeffs.shape[0] - 1
+    shape = np.broadcast(s, coeffs[0]).shape
+    # Add axes so that ``coeffs[j]`` broadcasts against ``s``.
+    extra_dims = (1,) * (len(shape) - coeffs.ndim + 1)
+    new_shape = coeffs.shape[:1] + extra_dims + coeffs.shape[1:]
+    level_shape = (degree + 1,) + shape
+    bk = {0: np.broadcast_to(coeffs.reshape(new_shape), level_shape)}
+    # NOTE: This will be shared, but is read only.
+    all_zero = np.zeros(level_shape)
+    for F in range(1, K - 1 + 1):
+        bk[F] = all_zero
+    if coeff_errors is not None:
+        for F, errors in enumerate(coeff_errors, start=1):
+            errors = np.asarray(errors, dtype=np.float64)
+            bk[F] = np.broadcast_to(errors.reshape(new_shape), level_shape)
+
+    mu = None
+    if with_bound:
+        abs_s = abs(s)
+        abs_r = abs(r) + abs(rho)
+        mu = all_zero
+
+    # NOTE: The values that only depend on the point(s) are split once
+    #       and shared by every product (and, e.g. for vector-valued
+    #       control points, by every coordinate).
+    s_split = eft._split_array(s)
+    r_split = eft._split_array(r)
+    rho_split = eft._split_array(rho)
+
+    yield bk, mu
+
+    for k in range(degree):
+        num_vals = degree - k
+        new_bk = {}
+
+        # Update the "level 0" stuff.
+        P1, pi1 = eft.multiply_eft_array(
+            r, bk[0][:num_vals], split1=r_split
+        )
+        P2, pi2 = eft.multiply_eft_array(
+            s, bk[0][1 : num_vals + 1], split1=s_split
+        )
+        new_bk[0], sigma3 = eft.add_eft(P1, P2)
+
+        errors = [pi1, pi2, sigma3]
+        delta_b = bk[0][:num_vals]
+
+        for F in range(1, K - 2 + 1):
+            new_errors, l_hat = _local_error_eft_array(
+                errors, rho, delta_b, rho_split=rho_split
+            )
+            P1, pi1 = eft.multiply_eft_array(
+                s, bk[F][1 : num_vals + 1], split1=s_split
+            )
+            S2, sigma2 = eft.add_eft(l_hat, P1)
+            P3, pi3 = eft.multiply_eft_array(
+                r, bk[F][:num_vals], split1=r_split
+            )
+            new_bk[F], sigma4 = eft.add_eft(S2, P3)
+
+            new_errors.extend([pi1, sigma2, pi3, sigma4])
+            errors = new_errors
+            delta_b = bk[F][:num_vals]
+
+        # Update the "level 2" stuff.
+        if with_bound:
+            new_bk[K - 1], local_err = _top_level_bound(
+                errors,
+                rho,
+                delta_b,
+                s,
+                r,
+                bk[K - 1][1 : num_vals + 1],
+                bk[K - 1][:num_vals],
+            )
+            mu = (
+                local_err
+                + abs_s * mu[1 : num_vals + 1]
+                + abs_r * mu[:num_vals]
+            )
+        else:
             l_hat = local_error(errors, rho, delta_b)
-            new_bk[K - 1].append(
-                l_hat + s * bk[K - 1][j + 1] + r * bk[K - 1][j]
+            new_bk[K - 1] = (
+                l_hat
+                + s * bk[K - 1][1 : num_vals + 1]
+                + r * bk[K - 1][:num_vals]
             )
 
         # Update the "current" values.
         bk = new_bk
 
-    return tuple(bk[F][0] for F in range(K - 1 + 1))
+        yield bk, mu
+
+
+def compensated_many(s_vals, coeffs, K=2, with_bound=False):
+    """Performs ``K``-compensated de Casteljau at many points.
+
+    This is a vectorized version of :func:`compensated` (or
+    :func:`compensated3`, etc. depending on ``K``); the final
+    :func:`eft.sum_k` is also vectorized across points. The result
+    matches the scalar functions bit-for-bit.
+
+    Args:
+        s_vals (numpy.ndarray): The points to evaluate at (any shape).
+        coeffs (Sequence[float]): The Bernstein coefficients.
+        K (Optional[int]): The number of compensation levels. Defaults
+            to ``2``.
+        with_bound (Optional[bool]): Indicates if a rigorous error bound
+            (as in :func:`compensated_with_bound`) should be returned
+            for each value. Defaults to :data:`False`.
+
+    Returns:
+        Union[numpy.ndarray, Tuple[numpy.ndarray, numpy.ndarray]]: The
+        evaluated values, with the same shape as ``s_vals``. If
+        ``with_bound`` is :data:`True`, the bounds (with the same shape)
+        are also returned.
+    """
+    if not with_bound:
+        terms = _compensated_k_array(s_vals, coeffs, K)
+        return eft.sum_k_array(terms, K)
+
+    terms, triangle_bound = _compensated_k_array(
+        s_vals, coeffs, K, with_bound=True
+    )
+    result = eft.sum_k_array(terms, K)
+    return result, _total_bound(result, terms, triangle_bound)
+
+
+def condition_number(s_vals, coeffs, K=2):
+    r"""Estimate the condition number of evaluation at many points.
+
+    The condition number of evaluating :math:`p(s)` is
+
+    .. math::
+
+        \operatorname{cond}(p, s) = \frac{\widetilde{p}(s)}{|p(s)|}, \quad
+        \widetilde{p}(s) = \sum_{j = 0}^n |b_j| \binom{n}{j}
+            |1 - s|^{n - j} |s|^j.
+
+    Since every term is non-negative, :math:`\widetilde{p}` is computed
+    accurately by the "standard" de Casteljau algorithm (with
+    :math:`|s|, |1 - s|` and :math:`|b_j|`). The value :math:`p(s)` is
+    computed with :func:`compensated_many`, so the estimate is accurate
+    as long as :math:`\operatorname{cond}(p, s)` is not much larger than
+    :math:`1 / \mathbf{u}^K`.
+
+    Args:
+        s_vals (numpy.ndarray): The points to evaluate at (any shape).
+        coeffs (Sequence[float]): The Bernstein coefficients.
+        K (Optional[int]): The number of compensation levels used to
+            compute :math:`p(s)`. Defaults to ``2``.
+
+    Returns:
+        numpy.ndarray: The (estimated) condition numbers, with the same
+        shape as ``s_vals``. The value is ``inf`` where the computed
+        :math:`p(s)` is zero (and ``nan`` if every coefficient is zero).
+    """
+    s_vals = np.asarray(s_vals, dtype=np.float64)
+    s = s_vals.reshape(-1)
+    abs_coeffs = np.abs(np.asarray(coeffs, dtype=np.float64))
+    p_tilde = _basic_array(np.abs(s), np.abs(1.0 - s), abs_coeffs)
+    p_abs = np.abs(compensated_many(s, coeffs, K=K))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = p_tilde / p_abs
+    return result.reshape(s_vals.shape)
+
+
+def compensated_matrix(s, coeffs, K=2):
+    r"""Performs ``K``-compensated de Casteljau for many polynomials.
+
+    Every row of ``coeffs`` is a polynomial (of the same degree) and all
+    rows are evaluated in one vectorized pass. When a single ``s`` is
+    used, :math:`\widehat{r}, \rho` (and the EFTs that only depend on
+    ``s``) are computed once and shared by every row.
+
+    Args:
+        s (Union[float, numpy.ndarray]): Either a single point shared by
+            every row or one point per row (i.e. with shape
+            ``(num_polys,)``).
+        coeffs (numpy.ndarray): The Bernstein coefficients, with shape
+            ``(num_polys, degree + 1)``.
+        K (Optional[int]): The number of compensation levels. Defaults
+            to ``2``.
+
+    Returns:
+        numpy.ndarray: The evaluated values, with shape ``(num_polys,)``.
+        Each matches :func:`compensated` (or :func:`compensated3`, etc.)
+        on the corresponding row bit-for-bit.
+    """
+    coeffs = np.asarray(coeffs, dtype=np.float64)
+    terms = _compensated_k_array(s, coeffs.T, K)
+    return eft.sum_k_array(terms, K)
 
 
-def compensated(s, coeffs):
+def compensated_curve(s_vals, nodes, K=2):
+    r"""Performs ``K``-compensated de Casteljau for a curve.
+
+    The control points are vector-valued (e.g. a curve in
+    :math:`\mathbf{R}^d`) and every coordinate is evaluated in a single
+    vectorized pass. The work that only depends on the point (i.e.
+    :math:`\widehat{r}, \rho` and the splits used in the EFTs for
+    products) is done once per point and shared by every coordinate.
+    Points are evaluated in chunks (of about ``4096 / d`` points) to keep
+    the working set for each level of the triangle small.
+
+    Args:
+        s_vals (Union[float, numpy.ndarray]): The point(s) to evaluate
+            at (any shape).
+        nodes (numpy.ndarray): The control points, with shape
+            ``(degree + 1, d)``.
+        K (Optional[int]): The number of compensation levels. Defaults
+            to ``2``.
+
+    Returns:
+        numpy.ndarray: The points on the curve, with shape
+        ``s_vals.shape + (d,)``. Each coordinate matches
+        :func:`compensated` (or :func:`compensated3`, etc.) on the
+        corresponding column of ``nodes`` bit-for-bit.
+    """
+    s_vals = np.asarray(s_vals, dtype=np.float64)
+    nodes = np.asarray(nodes, dtype=np.float64)
+    dimension = nodes.shape[1]
+    s_flat = s_vals.reshape(-1)
+    # NOTE: The coordinates are evaluated along the **first** axis (i.e.
+    #       the points are contiguous) and the points are processed in
+    #       chunks so that the arrays for each level stay in cache.
+    nodes = nodes[:, :, np.newaxis]
+    chunk_size = max(1, _CURVE_CHUNK_VALUES // dimension)
+    result = np.empty((dimension, s_flat.size))
+    for start in range(0, s_flat.size, chunk_size):
+        chunk = slice(start, start + chunk_size)
+        terms = _compensated_k_array(s_flat[chunk], nodes, K)
+        result[:, chunk] = eft.sum_k_array(terms, K)
+
+    return result.T.reshape(s_vals.shape + (dimension,))
+
+
+def _round_up(value, num_ops):
+    r"""Inflate a computed (non-negative) bound to account for round-off.
+
+    If ``value`` was computed from exact non-negative quantities using
+    at most ``num_ops`` additions / multiplications, then the exact value
+    is at most :math:`(1 + \gamma_{\mathtt{num\_ops}})` times ``value``,
+    which is (with room to spare for this multiplication) less than the
+    result.
+    """
+    return value * (1.0 + 2 * (num_ops + 1) * _U)
+
+
+def _triangle_bound(mu, K, degree):
+    """Round up the propagated error bound from the last level.
+
+    This is for the bound computed in :func:`_compensated_k` (with
+    ``with_bound=True``). On the last level each node combines ``5K - 7``
+    errors with 6 other terms and then the propagation adds 3 operations
+    per level.
+    """
+    if degree == 0:
+        return mu
+
+    return _round_up(mu, 5 * K + 3 * degree + 2)
+
+
+def _sum_k_bound(result, components):
+    """Bound the error in the result of :func:`eft.sum_k`.
+
+    See Proposition 4.10 in https://doi.org/10.1137/030601818 (the leading
+    constants are doubled to absorb the difference between the exact and
+    computed sums). This works for scalars and for arrays (elementwise).
+    """
+    K = len(components)
+    abs_sum = 0.0
+    for component in components:
+        abs_sum += abs(component)
+    gamma = (2 * K - 2) * _U / (1.0 - (2 * K - 2) * _U)
+    return 2 * _U * abs(result) + 2 * gamma ** K * abs_sum
+
+
+def _total_bound(result, components, triangle_bound):
+    """Combine the bounds on the triangle and on the final sum."""
+    sum_bound = _sum_k_bound(result, components)
+    return _round_up(triangle_bound + sum_bound, 2 * len(components) + 4)
+
+
+def _adaptive_level_zero(s, r, coeffs):
+    """Compute the "level 0" triangle for :func:`evaluate_adaptive`.
+
+    Returns the rows of the triangle and the errors (for each node after
+    the first row) that are passed on to the next level.
+    """
+    degree = len(coeffs) - 1
+    rows = [list(coeffs)]
+    all_errors = [None]
+    for k in range(degree):
+        prev_row = rows[k]
+        row = []
+        row_errors = []
+        for j in range(degree - k):
+            P1, pi1 = eft.multiply_eft(r, prev_row[j])
+            P2, pi2 = eft.multiply_eft(s, prev_row[j + 1])
+            S3, sigma3 = eft.add_eft(P1, P2)
+            row.append(S3)
+            row_errors.append([pi1, pi2, sigma3])
+
+        rows.append(row)
+        all_errors.append(row_errors)
+
+    return rows, all_errors
+
+
+def _adaptive_next_level(s, r, rho, prev_rows, prev_errors):
+    """Compute the next level triangle for :func:`evaluate_adaptive`.
+
+    The operations performed are exactly those done in
+    :func:`_compensated_k` for levels ``F = 1, ..., K - 2``, but the
+    errors are kept for every level (rather than only while computing
+    the next level) so that another level can be added later.
+    """
+    degree = len(prev_rows) - 1
+    rows = [[0.0] * (degree + 1)]
+    all_errors = [None]
+    for k in range(degree):
+        prev_row = rows[k]
+        row = []
+        row_errors = []
+        for j in range(degree - k):
+            new_errors, l_hat = local_error_eft(
+                prev_errors[k + 1][j], rho, prev_rows[k][j]
+            )
+            P1, pi1 = eft.multiply_eft(s, prev_row[j + 1])
+            S2, sigma2 = eft.add_eft(l_hat, P1)
+            P3, pi3 = eft.multiply_eft(r, prev_row[j])
+            S, sigma4 = eft.add_eft(S2, P3)
+            row.append(S)
+            new_errors.extend([pi1, sigma2, pi3, sigma4])
+            row_errors.append(new_errors)
+
+        rows.append(row)
+        all_errors.append(row_errors)
+
+    return rows, all_errors
+
+
+def _adaptive_bound(s, r, rho, result, components, rows, all_errors):
+    r"""Bound the error when the top level (``rows``) is the last one.
+
+    For each node, the errors produced at the top level (plus
+    :math:`\rho` times the previous top level value) are exactly the
+    information that is "dropped" by not computing another level. These
+    are propagated through the (absolute value of the) de Casteljau
+    recurrence and the error from the final :func:`eft.sum_k` is added.
+    """
+    degree = len(rows) - 1
+    abs_s = abs(s)
+    abs_r = abs(r) + abs(rho)
+    abs_rho = abs(rho)
+
+    mu = [0.0] * (degree + 1)
+    for k in range(degree):
+        for j in range(degree - k):
+            local_err = abs_rho * abs(rows[k][j])
+            for error in all_errors[k + 1][j]:
+                local_err += abs(error)
+            mu[j] = local_err + abs_s * mu[j + 1] + abs_r * mu[j]
+
+    num_ops = len(all_errors[-1][0]) + 3 * degree + 2 if degree else 0
+    triangle_bound = _round_up(mu[0], num_ops)
+
+    return _total_bound(result, components, triangle_bound)
+
+
+def evaluate_adaptive(s, coeffs, rtol, max_k=5):
+    """Evaluate with the smallest ``K`` that meets a relative tolerance.
+
+    This starts with ``K = 2`` and checks an (a posteriori) error bound on
+    the result. Only when the bound exceeds ``rtol`` times the result is
+    another level added, and the levels already computed are re-used
+    rather than starting over. Until the last level, each level is
+    computed with error-free transformations, exactly as in
+    :func:`_compensated_k`, so the result for a given ``K`` matches
+    :func:`compensated` (or :func:`compensated3`, etc.) bit-for-bit.
+
+    .. note::
+
+       The bound assumes that no underflow or overflow occurs.
+
+    Args:
+        s (float): The point to evaluate at.
+        coeffs (Sequence[float]): The Bernstein coefficients.
+        rtol (float): The desired relative error.
+        max_k (Optional[int]): The largest ``K`` to use. Defaults to ``5``.
+
+    Returns:
+        Tuple[float, int]: The evaluated value and the ``K`` used.
+    """
+    r, rho = eft.add_eft(1.0, -s)
+
+    rows, all_errors = _adaptive_level_zero(s, r, coeffs)
+    components = [rows[-1][0]]
+    while True:
+        rows, all_errors = _adaptive_next_level(s, r, rho, rows, all_errors)
+        components.append(rows[-1][0])
+        K = len(components)
+        result = eft.sum_k(components, K)
+        if K >= max_k:
+            return result, K
+
+        bound = _adaptive_bound(
+            s, r, rho, result, components, rows, all_errors
+        )
+        if bound <= rtol * abs(result):
+            return result, K
+
+
+def _sum_terms(terms, K, faithful):
+    # Helper for the ``compensated*`` functions.
+    if faithful:
+        return eft.acc_sum(terms)
+    return eft.sum_k(terms, K)
+
+
+def compensated(s, coeffs, faithful=False):
+    """Compensated de Casteljau algorithm.
+
+    If ``faithful`` is :data:`True`, the terms are summed via
+    :func:`eft.acc_sum` instead of :func:`eft.sum_k`, which guarantees
+    the sum of the terms is faithfully rounded (at the cost of a
+    data-dependent number of passes). The same holds for
+    :func:`compensated3`, :func:`compensated4` and :func:`compensated5`.
+    """
     b, db = _compensated_k(s, coeffs, 2)
-    return eft.sum_k((b, db), 2)
+    return _sum_terms((b, db), 2, faithful)
 
 
-def compensated3(s, coeffs):
+def compensated3(s, coeffs, faithful=False):
     b, db, d2b = _compensated_k(s, coeffs, 3)
-    return eft.sum_k((b, db, d2b), 3)
+    return _sum_terms((b, db, d2b), 3, faithful)
 
 
-def compensated4(s, coeffs):
+def compensated4(s, coeffs, faithful=False):
     b, db, d2b, d3b = _compensated_k(s, coeffs, 4)
-    return eft.sum_k((b, db, d2b, d3b), 4)
+    return _sum_terms((b, db, d2b, d3b), 4, faithful)
 
 
-def compensated5(s, coeffs):
+def compensated5(s, coeffs, faithful=False):
     b, db, d2b, d3b, d4b = _compensated_k(s, coeffs, 5)
-    return eft.sum_k((b, db, d2b, d3b, d4b), 5)
+    return _sum_terms((b, db, d2b, d3b, d4b), 5, faithful)
+
+
+def accumulate(s, coeffs, accumulator, K=2):
+    r"""Add the terms of ``K``-compensated de Casteljau to an accumulator.
+
+    Rather than being summed (as in :func:`compensated`), each of the
+    ``K`` components :math:`\widehat{\partial^F b}` of :math:`p(s)` is
+    added to ``accumulator`` (an :class:`eft.SumKAccumulator`) directly
+    from the last level of the triangle. For example, after calling this
+    at many points, ``accumulator.result(K)`` is the ``K``-fold
+    compensated sum of :math:`p` over those points.
+
+    Args:
+        s (float): The point to evaluate at.
+        coeffs (Sequence[float]): The Bernstein coefficients.
+        accumulator (eft.SumKAccumulator): The accumulator to add the
+            terms to.
+        K (Optional[int]): The number of compensation levels. Defaults
+            to ``2``.
+
+    Raises:
+        ValueError: If ``accumulator.max_k`` is less than ``K``.
+    """
+    if accumulator.max_k < K:
+        raise ValueError(
+            "The accumulator does not support K", K, accumulator.max_k
+        )
+
+    for bk, _ in _compensated_k_levels(s, coeffs, K):
+        pass
+    accumulator.extend(bk[F][0] for F in range(K))
+
+
+def compensated_with_bound(s, coeffs, K=2):
+    """Compensated de Casteljau algorithm with an error bound.
+
+    The value matches :func:`compensated` (or :func:`compensated3`, etc.
+    depending on ``K``) bit-for-bit. The bound is computed in the same
+    pass over the triangle (see :func:`_compensated_k`) and is typically
+    many orders of magnitude smaller than the a priori bounds, so it can
+    be used to decide if a larger ``K`` is needed.
+
+    .. note::
+
+       The bound assumes that no underflow or overflow occurs.
+
+    Args:
+        s (float): The point to evaluate at.
+        coeffs (Sequence[float]): The Bernstein coefficients.
+        K (Optional[int]): The number of compensation levels. Defaults
+            to ``2``.
+
+    Returns:
+        Tuple[float, float]: The evaluated value and a bound on the
+        absolute error in it.
+    """
+    terms, triangle_bound = _compensated_k(s, coeffs, K, with_bound=True)
+    result = eft.sum_k(terms, K)
+    return result, _total_bound(result, terms, triangle_bound)
+
+
+def _derivative_terms(bk, order, K):
+    r"""Get the terms that sum to a (scaled) derivative.
+
+    If ``bk`` is level ``degree - order`` of the triangle, then (up to a
+    factor of :math:`n` or :math:`n(n - 1)`) the first derivative is
+    :math:`b_1 - b_0` and the second derivative is
+    :math:`b_2 - 2 b_1 + b_0`. Since each :math:`b_j` is the (unevaluated)
+    sum of ``K`` components, the derivative is the sum of ``2K`` (or
+    ``3K``) terms. Each term is exact (negation and doubling are exact).
+    """
+    terms = []
+    for F in range(K - 1 + 1):
+        if order == 1:
+            terms.extend((bk[F][1], -bk[F][0]))
+        else:
+            terms.extend((bk[F][2], -2.0 * bk[F][1], bk[F][0]))
+
+    return terms
+
+
+def _with_derivative(levels, degree, K, second, sum_k, zero):
+    # Helper for the ``compensated_with_derivative*`` functions.
+    num_keep = 3 if second else 2
+    last_levels = collections.deque(maxlen=num_keep)
+    for bk, _ in levels:
+        last_levels.append(bk)
+
+    value_terms = [bk[F][0] for F in range(K - 1 + 1)]
+    result = [sum_k(value_terms, K)]
+    for order in range(1, num_keep):
+        if degree < order:
+            result.append(zero)
+            continue
+
+        terms = _derivative_terms(last_levels[-1 - order], order, K)
+        scale = float(degree)
+        if order == 2:
+            scale *= degree - 1
+        result.append(scale * sum_k(terms, K))
+
+    return tuple(result)
+
+
+def compensated_with_derivative(s, coeffs, K=2, second=False):
+    r"""Compensated de Casteljau algorithm with derivative(s).
+
+    The level before the last in the triangle holds (up to a factor of
+    :math:`n`) the hodograph evaluated at ``s``:
+
+    .. math::
+
+        p'(s) = n \left(b_1^{(n - 1)} - b_0^{(n - 1)}\right)
+
+    and similarly the level before that gives :math:`p''(s)`. The
+    ``K`` components of these nodes are kept during a single sweep (see
+    :func:`_compensated_k_levels`) and each derivative is computed with
+    :func:`eft.sum_k` so that it is as accurate as if computed in
+    ``K``-fold precision (before the final scaling by :math:`n`, which
+    is exact when :math:`n` is a power of two). The value matches
+    :func:`compensated` (or :func:`compensated3`, etc.) bit-for-bit.
+
+    Args:
+        s (float): The point to evaluate at.
+        coeffs (Sequence[float]): The Bernstein coefficients.
+        K (Optional[int]): The number of compensation levels. Defaults
+            to ``2``.
+        second (Optional[bool]): Indicates if the second derivative
+            should also be computed. Defaults to :data:`False`.
+
+    Returns:
+        Tuple[float, ...]: The value :math:`p(s)`, the derivative
+        :math:`p'(s)` and (if ``second`` is :data:`True`) the second
+        derivative :math:`p''(s)`.
+    """
+    degree = len(coeffs) - 1
+    levels = _compensated_k_levels(s, coeffs, K)
+    return _with_derivative(levels, degree, K, second, eft.sum_k, 0.0)
+
+
+def compensated_with_derivative_many(s_vals, coeffs, K=2, second=False):
+    """Vectorized version of :func:`compensated_with_derivative`.
+
+    Args:
+        s_vals (numpy.ndarray): The points to evaluate at (any shape).
+        coeffs (Sequence[float]): The Bernstein coefficients.
+        K (Optional[int]): The number of compensation levels. Defaults
+            to ``2``.
+        second (Optional[bool]): Indicates if the second derivative
+            should also be computed. Defaults to :data:`False`.
+
+    Returns:
+        Tuple[numpy.ndarray, ...]: The values, derivatives and (if
+        ``second`` is :data:`True`) second derivatives, each with the
+        same shape as ``s_vals``. These match
+        :func:`compensated_with_derivative` bit-for-bit.
+    """
+    s_vals = np.asarray(s_vals, dtype=np.float64)
+    degree = len(coeffs) - 1
+    levels = _compensated_k_array_levels(s_vals, coeffs, K)
+    zero = np.zeros(s_vals.shape)
+    return _with_derivative(
+        levels, degree, K, second, eft.sum_k_array, zero
+    )
+
+
+def _check_coeff_errors(coeff_errors, K):
+    # Helper for the ``subdivide*`` functions.
+    if coeff_errors is not None and len(coeff_errors) > K - 1:
+        raise ValueError(
+            "At most K - 1 error components can be used",
+            len(coeff_errors),
+            K,
+        )
+
+
+def _triangle_edges(levels, K):
+    """Collect the left and right edges of the triangle.
+
+    The control points of the left half are :math:`b_0^{(j)}` (the first
+    node of each level) and those of the right half are
+    :math:`b_j^{(n - j)}` (the last node of each level, in reverse).
+    """
+    left = {F: [] for F in range(K - 1 + 1)}
+    right = {F: [] for F in range(K - 1 + 1)}
+    for bk, _ in levels:
+        for F in range(K - 1 + 1):
+            left[F].append(bk[F][0])
+            right[F].append(bk[F][-1])
+
+    for F in range(K - 1 + 1):
+        right[F].reverse()
+
+    return left, right
+
+
+def subdivide(s, coeffs, K=2, coeff_errors=None):
+    r"""Subdivide a Bezier curve with compensated de Casteljau.
+
+    The control points of the halves on :math:`\left[0, s\right]` and
+    :math:`\left[s, 1\right]` are the edges of the same triangle used by
+    :func:`compensated` (and :func:`compensated3`, etc.), so they are
+    collected during a single sweep. Each half is returned as ``K``
+    components: the first is the control points computed by
+    :func:`basic` and the rest are the (compensated) corrections to
+    them; :func:`eft.sum_k` of the components gives the control points
+    as if computed in ``K``-fold precision. In particular, the last
+    control point of the left half (and the first of the right half) is
+    evaluated as in :func:`compensated`.
+
+    The components can be passed back in (as ``coeffs`` and
+    ``coeff_errors``) to subdivide a half again without losing the
+    corrections.
+
+    Args:
+        s (float): The point to subdivide at.
+        coeffs (Sequence[float]): The Bernstein coefficients.
+        K (Optional[int]): The number of compensation levels. Defaults
+            to ``2``.
+        coeff_errors (Optional[Sequence[Sequence[float]]]): At most
+            ``K - 1`` error components for ``coeffs``.
+
+    Returns:
+        Tuple[Tuple[Tuple[float, ...], ...], ...]: The ``K``
+        components of the left and right halves.
+
+    Raises:
+        ValueError: If there are more than ``K - 1`` error components.
+    """
+    _check_coeff_errors(coeff_errors, K)
+    levels = _compensated_k_levels(s, coeffs, K, coeff_errors=coeff_errors)
+    left, right = _triangle_edges(levels, K)
+    return (
+        tuple(tuple(left[F]) for F in range(K - 1 + 1)),
+        tuple(tuple(right[F]) for F in range(K - 1 + 1)),
+    )
+
+
+def subdivide_many(s, coeffs, K=2, coeff_errors=None):
+    """Vectorized version of :func:`subdivide`.
+
+    This can subdivide one polynomial at many points or many polynomials
+    at once (e.g. each at its own point for recursive clipping).
+
+    Args:
+        s (Union[float, numpy.ndarray]): The point(s) to subdivide at.
+        coeffs (numpy.ndarray): The Bernstein coefficients, with shape
+            ``(degree + 1,) + shape`` where ``shape`` can be broadcast
+            against the shape of ``s``.
+        K (Optional[int]): The number of compensation levels. Defaults
+            to ``2``.
+        coeff_errors (Optional[Sequence[numpy.ndarray]]): At most
+            ``K - 1`` error components, each with the same shape as
+            ``coeffs``.
+
+    Returns:
+        Tuple[Tuple[numpy.ndarray, ...], Tuple[numpy.ndarray, ...]]: The
+        ``K`` components of the left and right halves, each with shape
+        ``(degree + 1,) + shape`` (where ``shape`` is the broadcast
+        shape of the points). These match :func:`subdivide`
+        bit-for-bit.
+
+    Raises:
+        ValueError: If there are more than ``K - 1`` error components.
+    """
+    _check_coeff_errors(coeff_errors, K)
+    levels = _compensated_k_array_levels(
+        s, coeffs, K, coeff_errors=coeff_errors
+    )
+    left, right = _triangle_edges(levels, K)
+    return (
+        tuple(np.stack(left[F]) for F in range(K - 1 + 1)),
+        tuple(np.stack(right[F]) for F in range(K - 1 + 1)),
+    )
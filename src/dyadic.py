@@ -0,0 +1,278 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Exact arithmetic with dyadic rationals.
+
+Every (finite) float is a dyadic rational :math:`m \cdot 2^e`, and so are
+sums and products of them. This module represents such a value as a pair
+``(mantissa, exponent)`` of Python :class:`int`-s. Unlike
+:class:`fractions.Fraction`, no GCD is computed after each operation:
+the exponents are aligned with shifts and the mantissas are added or
+multiplied.
+
+In particular, :func:`de_casteljau` evaluates a polynomial in Bernstein
+form **exactly** at a float :math:`s`. Writing :math:`s = a / 2^q` (and
+hence :math:`1 - s = (2^q - a) / 2^q`) and putting all coefficients over
+a shared power of two, each step of the recurrence is just two integer
+products and an integer sum.
+
+Conversion back to a float (via :func:`to_float` or
+:func:`ratio_to_float`) uses integer true division, which is correctly
+rounded, so results match ``float(fractions.Fraction(...))``.
+"""
+
+import fractions
+
+
+def _normalize(mantissa, exponent):
+    """Remove trailing zero bits from the mantissa.
+
+    This keeps the representation unique (and the mantissa small); zero
+    is always ``(0, 0)``.
+    """
+    if mantissa == 0:
+        return 0, 0
+
+    num_zeros = (mantissa & -mantissa).bit_length() - 1
+    return mantissa >> num_zeros, exponent + num_zeros
+
+
+def from_float(value):
+    """Convert a float to a dyadic rational.
+
+    Args:
+        value (float): A finite value.
+
+    Returns:
+        Tuple[int, int]: The mantissa and exponent.
+    """
+    numerator, denominator = value.as_integer_ratio()
+    # NOTE: ``denominator`` is a power of two.
+    return _normalize(numerator, 1 - denominator.bit_length())
+
+
+def to_float(value):
+    """Convert a dyadic rational to the nearest float.
+
+    Args:
+        value (Tuple[int, int]): The mantissa and exponent.
+
+    Returns:
+        float: The correctly rounded value.
+    """
+    mantissa, exponent = value
+    if exponent >= 0:
+        return float(mantissa << exponent)
+
+    return mantissa / (1 << -exponent)
+
+
+def to_fraction(value):
+    """Convert a dyadic rational to a fraction.
+
+    Args:
+        value (Tuple[int, int]): The mantissa and exponent.
+
+    Returns:
+        fractions.Fraction: The exact value.
+    """
+    mantissa, exponent = value
+    if exponent >= 0:
+        return fractions.Fraction(mantissa << exponent)
+
+    return fractions.Fraction(mantissa, 1 << -exponent)
+
+
+def add(value1, value2):
+    """Add two dyadic rationals (exactly).
+
+    Args:
+        value1 (Tuple[int, int]): The mantissa and exponent of the first
+            value.
+        value2 (Tuple[int, int]): The mantissa and exponent of the second
+            value.
+
+    Returns:
+        Tuple[int, int]: The mantissa and exponent of the sum.
+    """
+    mantissa1, exponent1 = value1
+    mantissa2, exponent2 = value2
+    if exponent1 < exponent2:
+        return _normalize(
+            mantissa1 + (mantissa2 << (exponent2 - exponent1)), exponent1
+        )
+
+    return _normalize(
+        (mantissa1 << (exponent1 - exponent2)) + mantissa2, exponent2
+    )
+
+
+def subtract(value1, value2):
+    """Subtract two dyadic rationals (exactly).
+
+    Args:
+        value1 (Tuple[int, int]): The mantissa and exponent of the first
+            value.
+        value2 (Tuple[int, int]): The mantissa and exponent of the value
+            being subtracted.
+
+    Returns:
+        Tuple[int, int]: The mantissa and exponent of the difference.
+    """
+    mantissa2, exponent2 = value2
+    return add(value1, (-mantissa2, exponent2))
+
+
+def multiply(value1, value2):
+    """Multiply two dyadic rationals (exactly).
+
+    Args:
+        value1 (Tuple[int, int]): The mantissa and exponent of the first
+            value.
+        value2 (Tuple[int, int]): The mantissa and exponent of the second
+            value.
+
+    Returns:
+        Tuple[int, int]: The mantissa and exponent of the product.
+    """
+    mantissa1, exponent1 = value1
+    mantissa2, exponent2 = value2
+    return _normalize(mantissa1 * mantissa2, exponent1 + exponent2)
+
+
+def ratio_to_float(numerator, denominator):
+    """Compute the float nearest to a ratio of dyadic rationals.
+
+    Args:
+        numerator (Tuple[int, int]): The mantissa and exponent of the
+            numerator.
+        denominator (Tuple[int, int]): The mantissa and exponent of the
+            (non-zero) denominator.
+
+    Returns:
+        float: The correctly rounded ratio.
+
+    Raises:
+        ZeroDivisionError: If the denominator is zero.
+    """
+    mantissa1, exponent1 = numerator
+    mantissa2, exponent2 = denominator
+    shift = exponent1 - exponent2
+    if shift >= 0:
+        return (mantissa1 << shift) / mantissa2
+
+    return mantissa1 / (mantissa2 << -shift)
+
+
+def _shared_exponent(coeffs):
+    """Put the coefficients over a shared power of two.
+
+    Returns:
+        Tuple[List[int], int]: The mantissas and the shared exponent.
+    """
+    values = [from_float(coeff) for coeff in coeffs]
+    # NOTE: Zero is ``(0, 0)``, so ``shared <= 0`` whenever a coefficient
+    #       is zero.
+    shared = min(exponent for _, exponent in values)
+    mantissas = [
+        mantissa << (exponent - shared) for mantissa, exponent in values
+    ]
+    return mantissas, shared
+
+
+def _point(s):
+    """Write :math:`s = a / 2^q` with :math:`q \\geq 0`.
+
+    Returns:
+        Tuple[int, int]: The integers ``a`` and ``q``.
+    """
+    mantissa, exponent = from_float(s)
+    if exponent >= 0:
+        return mantissa << exponent, 0
+
+    return mantissa, -exponent
+
+
+def _evaluate(s, mantissas, shared):
+    """Perform de Casteljau's method on shared-exponent mantissas.
+
+    Returns:
+        Tuple[int, int]: The mantissa and exponent of :math:`p(s)`.
+    """
+    a, q = _point(s)
+    b = (1 << q) - a
+    pk = list(mantissas)
+
+    degree = len(pk) - 1
+    for k in range(degree):
+        for j in range(degree - k):
+            pk[j] = b * pk[j] + a * pk[j + 1]
+
+    return _normalize(pk[0], shared - degree * q)
+
+
+def triangle(s, coeffs):
+    """Perform de Casteljau's method exactly, keeping every level.
+
+    Args:
+        s (float): The point to evaluate at.
+        coeffs (Sequence[float]): The Bernstein coefficients.
+
+    Returns:
+        List[List[Tuple[int, int]]]: The values at each level of the
+        triangle: the first level is ``coeffs`` and the last contains
+        only :math:`p(s)`.
+    """
+    a, q = _point(s)
+    b = (1 << q) - a
+    pk, shared = _shared_exponent(coeffs)
+    levels = [[_normalize(mantissa, shared) for mantissa in pk]]
+
+    degree = len(pk) - 1
+    for k in range(degree):
+        pk = [b * pk[j] + a * pk[j + 1] for j in range(degree - k)]
+        shared -= q
+        levels.append([_normalize(mantissa, shared) for mantissa in pk])
+
+    return levels
+
+
+def de_casteljau(s, coeffs):
+    """Evaluate a polynomial in Bernstein form exactly.
+
+    Args:
+        s (float): The point to evaluate at.
+        coeffs (Sequence[float]): The Bernstein coefficients.
+
+    Returns:
+        Tuple[int, int]: The mantissa and exponent of :math:`p(s)`.
+    """
+    mantissas, shared = _shared_exponent(coeffs)
+    return _evaluate(s, mantissas, shared)
+
+
+def de_casteljau_many(s_vals, coeffs):
+    """Evaluate a polynomial in Bernstein form exactly at many points.
+
+    The coefficients are only converted (and put over a shared power of
+    two) once.
+
+    Args:
+        s_vals (Iterable[float]): The points to evaluate at.
+        coeffs (Sequence[float]): The Bernstein coefficients.
+
+    Returns:
+        List[Tuple[int, int]]: The mantissa and exponent of :math:`p(s)`
+        for each point.
+    """
+    mantissas, shared = _shared_exponent(coeffs)
+    return [_evaluate(s, mantissas, shared) for s in s_vals]
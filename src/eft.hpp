@@ -13,6 +13,7 @@
 #ifndef EFT_HPP
 #define EFT_HPP
 
+#include <cstddef>
 #include <utility>
 #include <vector>
 
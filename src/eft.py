@@ -13,7 +13,20 @@
 """Collection of error-free transforms."""
 
 
+import collections
+import ctypes
+import ctypes.util
 import fractions
+import math
+import struct
+
+try:
+    import numpy as np
+except ImportError:  # pragma: NO COVER
+    np = None
+
+_EPS = 0.5 ** 53
+_REALMIN = 0.5 ** 1022
 
 
 def add_eft(val1, val2):
@@ -32,20 +45,162 @@ def _split(val):
     return high_bits, low_bits
 
 
+def _fma_fraction(val1, val2, val3):
+    # Reference FMA backend: exact (but slow) rational arithmetic.
+    frac1 = fractions.Fraction(val1)
+    frac2 = fractions.Fraction(val2)
+    frac3 = fractions.Fraction(val3)
+    return float(frac1 * frac2 + frac3)
+
+
+def _round_to_odd_sum(val1, val2):
+    # Helper for ``_fma_dekker``: ``val1 + val2`` rounded to odd, i.e. the
+    # exact sum if it is representable and otherwise whichever of the two
+    # neighbouring floats has an odd last bit.
+    sum_, error = add_eft(val1, val2)
+    if error == 0.0:
+        return sum_
+
+    (bits,) = struct.unpack("<Q", struct.pack("<d", sum_))
+    if bits & 1:
+        return sum_
+    # NOTE: The neighbour on the other side of the exact sum is one unit in
+    #       the last place away (in the direction of ``error``).
+    if (error > 0.0) == (sum_ > 0.0):
+        bits += 1
+    else:
+        bits -= 1
+    (sum_,) = struct.unpack("<d", struct.pack("<Q", bits))
+    return sum_
+
+
+def _fma_dekker(val1, val2, val3):
+    # FMA backend emulated via Dekker's product.
+    # See: https://doi.org/10.1109/TC.2007.70819
+    # NOTE: The product ``uh + ul`` and the sum ``th + tl == val3 + uh``
+    #       are exact, and rounding ``tl + ul`` to odd ensures the final
+    #       (round to nearest) sum is the correctly rounded FMA. This
+    #       assumes no overflow (e.g. in ``_split``) or underflow occurs.
+    uh = val1 * val2
+    high1, low1 = _split(val1)
+    high2, low2 = _split(val2)
+    ul = low1 * low2 - (((uh - high1 * high2) - low1 * high2) - high1 * low2)
+    if val3 == -uh:
+        # Fast path for the error in a product (which is how
+        # ``multiply_eft`` uses FMA).
+        return ul
+
+    th, tl = add_eft(val3, uh)
+    return th + _round_to_odd_sum(tl, ul)
+
+
+def _load_libm_fma():
+    # FMA backend from the C math library, called via ``ctypes``.
+    name = ctypes.util.find_library("m")
+    if name is None:
+        return None
+
+    try:
+        libm = ctypes.CDLL(name)
+        func = libm.fma
+    except (OSError, AttributeError):
+        return None
+
+    func.restype = ctypes.c_double
+    func.argtypes = (ctypes.c_double, ctypes.c_double, ctypes.c_double)
+    return func
+
+
+def _is_exact_fma(func):
+    # Make sure a candidate backend really is fused, e.g. some platforms
+    # provide ``fma()`` as ``x * y + z`` (which is wrong here). The second
+    # case is a general FMA (i.e. not the error in a product) that is off
+    # by a rounding unless the sum is also correctly rounded.
+    val = 1.0 + 0.5 ** 27
+    if func(val, val, -1.0) != 0.5 ** 26 + 0.5 ** 54:
+        return False
+    val1 = 1.0 + 0.5 ** 52
+    val2 = 0.5 - 0.5 ** 53
+    return func(val1, val2, 2.0 ** 52 + 1.0) == 4503599627370497.0
+
+
+FMA_BACKENDS = collections.OrderedDict()
+# NOTE: The order of the backends determines the default; the first one
+#       that is available (and passes ``_is_exact_fma``) is used. The
+#       order is by the cost of ``multiply_eft``: calling ``fma()`` from
+#       libm via ``ctypes`` has more overhead than the (pure Python)
+#       Dekker product, so ``libm`` is only preferred to ``fraction``.
+_FMA_PREFERENCE = ("math", "dekker", "libm", "fraction")
+_FMA_NAME = None
+_FMA_FUNC = None
+
+
+def register_fma_backend(name, func):
+    """Register an FMA backend.
+
+    Args:
+        name (str): The name of the backend.
+        func (Callable[[float, float, float], float]): A correctly rounded
+            fused-multiply-add for ``float`` arguments.
+    """
+    FMA_BACKENDS[name] = func
+
+
+def set_fma_backend(name=None):
+    """Set the FMA backend used by :func:`multiply_eft`.
+
+    Args:
+        name (Optional[str]): The name of a registered backend. If not
+            provided, the fastest available backend is used.
+
+    Raises:
+        ValueError: If ``name`` is not a registered backend.
+    """
+    global _FMA_NAME, _FMA_FUNC
+
+    if name is None:
+        for name in _FMA_PREFERENCE:
+            func = FMA_BACKENDS.get(name)
+            if func is not None and _is_exact_fma(func):
+                break
+
+    if name not in FMA_BACKENDS:
+        raise ValueError("Unknown FMA backend", name, tuple(FMA_BACKENDS))
+
+    _FMA_NAME = name
+    _FMA_FUNC = FMA_BACKENDS[name]
+
+
+def get_fma_backend():
+    """Get the name of the current FMA backend."""
+    return _FMA_NAME
+
+
 def _fma(val1, val2, val3):
     if (
         isinstance(val1, float)
         and isinstance(val2, float)
         and isinstance(val3, float)
     ):
-        frac1 = fractions.Fraction(val1)
-        frac2 = fractions.Fraction(val2)
-        frac3 = fractions.Fraction(val3)
-        return float(frac1 * frac2 + frac3)
+        return _FMA_FUNC(val1, val2, val3)
     else:
         return val1.fma(val1, val2, val3)
 
 
+def _register_default_fma_backends():
+    if getattr(math, "fma", None) is not None:  # pragma: NO COVER
+        register_fma_backend("math", math.fma)
+    libm_fma = _load_libm_fma()
+    if libm_fma is not None:  # pragma: NO COVER
+        register_fma_backend("libm", libm_fma)
+    register_fma_backend("dekker", _fma_dekker)
+    register_fma_backend("fraction", _fma_fraction)
+    set_fma_backend()
+
+
+_register_default_fma_backends()
+
+
 def multiply_eft(val1, val2, use_fma=True):
     # See: https://doi.org/10.1109/TC.2008.215
     product = val1 * val2
@@ -61,6 +216,54 @@ def multiply_eft(val1, val2, use_fma=True):
     return product, error
 
 
+def add_eft_array(val1, val2):
+    """Elementwise version of :func:`add_eft` for NumPy arrays.
+
+    Exactly the same sequence of (IEEE-754 double precision) operations
+    is performed, so each entry matches :func:`add_eft` bit-for-bit.
+    """
+    val1 = np.asarray(val1, dtype=np.float64)
+    val2 = np.asarray(val2, dtype=np.float64)
+    return add_eft(val1, val2)
+
+
+def _split_array(val):
+    # Helper for ``multiply_eft_array``.
+    return _split(np.asarray(val, dtype=np.float64))
+
+
+def multiply_eft_array(val1, val2, split1=None):
+    """Elementwise version of :func:`multiply_eft` for NumPy arrays.
+
+    NumPy has no vectorized FMA, so the error is computed via Dekker's
+    product (i.e. the ``use_fma=False`` branch of :func:`multiply_eft`).
+    Since the error in a product is exactly representable, this is the
+    **same** value produced by the FMA branch, bit-for-bit.
+
+    When ``val1`` is re-used in many products (e.g. a point ``s`` in
+    de Casteljau's method) its split (from :func:`_split_array`) can be
+    computed once and passed in as ``split1``.
+
+    .. note::
+
+       As with the scalar version, this assumes the inputs are small
+       enough that splitting doesn't overflow and that the error does
+       not underflow.
+    """
+    val1 = np.asarray(val1, dtype=np.float64)
+    val2 = np.asarray(val2, dtype=np.float64)
+    product = val1 * val2
+    if split1 is None:
+        split1 = _split_array(val1)
+    high1, low1 = split1
+    high2, low2 = _split_array(val2)
+    error = low1 * low2 - (
+        ((product - high1 * high2) - low1 * high2) - high1 * low2
+    )
+
+    return product, error
+
+
 def _vec_sum(p):
     # See: https://doi.org/10.1137/030601818
     # Helper for ``sum_k``.
@@ -82,3 +285,393 @@ def sum_k(p, k):
         result += p_val
 
     return result
+
+
+def sum_k_array(p, k):
+    """Vectorized version of :func:`sum_k`.
+
+    The sum is taken over the first axis of ``p``, i.e. ``p[i]`` is an
+    array of values (one per sum) and each entry of the result matches
+    :func:`sum_k` bit-for-bit.
+    """
+    p = np.array(p, dtype=np.float64)  # Make a copy to be modified.
+
+    for _ in range(k - 1):
+        _vec_sum(p)
+
+    result = p[0].copy()
+    for p_val in p[1:]:
+        result += p_val
+
+    return result
+
+
+def dot_k(x, y, k):
+    """Compensated dot product (DotK).
+
+    .. _ORO05: https://doi.org/10.1137/030601818
+
+    This is the ``DotK`` algorithm from `ORO05`_: the dot product is
+    transformed (without error) into a sum of ``2n`` terms, which is
+    then computed via ``(K - 1)``-fold summation. The result is as
+    accurate as if computed in ``K`` times the working precision.
+
+    This assumes, but does not check, that ``K >= 2``.
+    """
+    n = len(x)
+    if n == 0:
+        return 0.0
+
+    product_errors = [None] * n
+    sum_errors = []
+    p, product_errors[0] = multiply_eft(x[0], y[0])
+    for i in range(1, n):
+        h, product_errors[i] = multiply_eft(x[i], y[i])
+        p, sum_error = add_eft(p, h)
+        sum_errors.append(sum_error)
+
+    return sum_k(product_errors + sum_errors + [p], k - 1)
+
+
+def dot_k_array(x, y, k):
+    """Vectorized version of :func:`dot_k`.
+
+    Computes many dot products at once: the vectors are along the **last**
+    axis of ``x`` and ``y`` (which are broadcast against each other), so
+    that, e.g. for inputs with shape ``(m, n)``, the result has shape
+    ``(m,)``. Each entry matches :func:`dot_k` bit-for-bit.
+    """
+    x, y = np.broadcast_arrays(
+        np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    )
+    n = x.shape[-1]
+    if n == 0:
+        return np.zeros(x.shape[:-1])
+
+    products, product_errors = multiply_eft_array(x, y)
+    terms = np.empty((2 * n,) + x.shape[:-1])
+    terms[:n] = np.moveaxis(product_errors, -1, 0)
+
+    p = products[..., 0]
+    for i in range(1, n):
+        p, terms[n + i - 1] = add_eft(p, products[..., i])
+    terms[2 * n - 1] = p
+
+    return sum_k_array(terms, k - 1)
+
+
+def _next_power_two(val):
+    # Helper for ``acc_sum``: the smallest power of 2 that is ``>= |val|``.
+    mantissa, exponent = math.frexp(abs(val))
+    if mantissa == 0.5:
+        return abs(val)
+    return math.ldexp(1.0, exponent)
+
+
+def _extract_vector(sigma, p):
+    # See: https://doi.org/10.1137/050645671
+    # Helper for ``acc_sum``: splits each ``p[i]`` into a "high" part
+    # (a multiple of ``eps sigma``) and a "low" part. The sum of the high
+    # parts is computed without error.
+    # NOTE: This modifies ``p`` in place.
+    tau = 0.0
+    for i, p_val in enumerate(p):
+        q = (sigma + p_val) - sigma
+        p[i] = p_val - q
+        tau += q
+    return tau
+
+
+def acc_sum(p):
+    """Faithfully rounded summation (AccSum).
+
+    .. _ROO08: https://doi.org/10.1137/050645671
+
+    This is the ``AccSum`` algorithm from `ROO08`_. Rather than using a
+    fixed number of distillation passes (as :func:`sum_k` does), the high
+    order parts of ``p`` are repeatedly extracted until the partial sum
+    is large enough to guarantee the result is a faithful rounding of the
+    exact sum. For well-conditioned sums this stops after a single pass.
+    """
+    p = list(p)  # Make a copy to be modified.
+    if not p:
+        return 0.0
+
+    mu = max(abs(p_val) for p_val in p)
+    if mu == 0.0:
+        return 0.0
+
+    num_bits = _next_power_two(len(p) + 2)
+    sigma = num_bits * _next_power_two(mu)
+    phi = num_bits * _EPS
+    factor = num_bits * num_bits * _EPS
+
+    t = 0.0
+    while True:
+        tau = _extract_vector(sigma, p)
+        tau1 = t + tau
+        if abs(tau1) >= factor * sigma or sigma <= _REALMIN:
+            tau2 = tau - (tau1 - t)
+            tau3 = 0.0
+            for p_val in p:
+                tau3 += p_val
+            return tau1 + (tau2 + tau3)
+
+        t = tau1
+        if t == 0.0:
+            # All of the high order parts have cancelled, start over with
+            # what is left.
+            return acc_sum(p)
+
+        sigma = phi * sigma
+
+
+def _cascade(value, level, running, totals, num_levels):
+    # Helper for ``SumKAccumulator``.
+    # NOTE: This modifies ``running`` and ``totals`` in place.
+    while True:
+        total = totals[level]
+        if total is None:
+            totals[level] = value
+        else:
+            totals[level] = total + value
+
+        if level == num_levels - 1:
+            return
+
+        prev = running[level]
+        if prev is None:
+            running[level] = value
+            return
+
+        # This is the step ``p[i], p[i - 1] = add_eft(p[i], p[i - 1])``
+        # from ``_vec_sum``; the error is the (now final) ``p[i - 1]``,
+        # which is the next entry seen by the following pass.
+        running[level], value = add_eft(value, prev)
+        level += 1
+
+
+class SumKAccumulator(object):
+    """Streaming version of :func:`sum_k`.
+
+    The ``K - 1`` passes of ``_vec_sum`` in :func:`sum_k` can be pipelined:
+    as soon as a pass has seen entry ``i``, entry ``i - 1`` is final and can
+    be fed to the next pass. So each incoming value is cascaded through the
+    passes and only the running sum of each pass (and the plain sum of the
+    values it produces) are stored, i.e. memory use is ``O(K)`` rather than
+    ``O(|p|)``.
+
+    The value of ``result(k)`` is **exactly** the same as that of
+    ``sum_k(values, k)`` (where ``values`` are all values added so far) for
+    any ``1 <= k <= max_k``.
+
+    Args:
+        max_k (int): The largest ``K`` that will be used with
+            :meth:`result`.
+    """
+
+    def __init__(self, max_k):
+        if max_k < 1:
+            raise ValueError("K must be at least 1", max_k)
+
+        self.max_k = max_k
+        # NOTE: ``_running[F]`` is the running sum for pass ``F + 1`` (which
+        #       consumes the output of pass ``F``) and ``_totals[F]`` is the
+        #       plain sum of all values produced by pass ``F`` (pass ``0``
+        #       being the values added).
+        self._running = [None] * (max_k - 1)
+        self._totals = [None] * max_k
+
+    def add(self, value):
+        """Add a single value to the sum."""
+        _cascade(value, 0, self._running, self._totals, self.max_k)
+
+    def extend(self, values):
+        """Add every value from an iterable to the sum."""
+        running = self._running
+        totals = self._totals
+        num_levels = self.max_k
+        for value in values:
+            _cascade(value, 0, running, totals, num_levels)
+
+    def result(self, k=None):
+        """Compute the ``K``-fold sum of all values added so far.
+
+        This does not modify the accumulator, so more values can be added
+        after calling it.
+
+        Args:
+            k (Optional[int]): The number of "folds" to use. Defaults to
+                ``max_k``.
+
+        Returns:
+            float: The compensated sum.
+
+        Raises:
+            ValueError: If ``k`` is not between ``1`` and ``max_k``.
+        """
+        if k is None:
+            k = self.max_k
+        if not 1 <= k <= self.max_k:
+            raise ValueError("K must be between 1 and max_k", k, self.max_k)
+
+        # Flush the final running sum of each pass (i.e. the last entry of
+        # ``p`` after that pass) into the next pass, using copies so that
+        # the accumulator can still be extended.
+        running = self._running[: k - 1]
+        totals = self._totals[:k]
+        for level in range(k - 1):
+            value = running[level]
+            if value is not None:
+                running[level] = None
+                _cascade(value, level + 1, running, totals, k)
+
+        if totals[k - 1] is None:
+            return 0.0
+        return totals[k - 1]
+
+
+def _renormalize(terms, num_components):
+    # Helper for ``MultiFloat``: converts ``terms`` into
+    # ``num_components`` values with (approximately) the same sum.
+    # NOTE: This modifies ``terms`` in place.
+    components = []
+    for _ in range(num_components - 1):
+        if not terms:
+            components.append(0.0)
+            continue
+        # After a pass, the last entry is the (recursive) sum and the rest
+        # are errors, so the remaining ``terms`` sum **exactly** to the
+        # residual.
+        _vec_sum(terms)
+        components.append(terms.pop())
+
+    last = 0.0
+    for term in terms:
+        last += term
+    components.append(last)
+
+    return tuple(components)
+
+
+class MultiFloat(object):
+    """A number stored as an unevaluated sum of ``float`` components.
+
+    Arithmetic is carried out with :func:`add_eft` and :func:`multiply_eft`
+    and the result is renormalized to a fixed number of components, so
+    that computations are done in (roughly) ``num_components`` times the
+    working precision. Since the usual arithmetic operators are supported,
+    functions like :func:`de_casteljau.basic` can be used unchanged.
+
+    This is a base class; use :class:`DoubleDouble` or :class:`TripleDouble`.
+
+    Args:
+        terms (float): The components, ordered from largest to smallest.
+            Any missing components are zero.
+    """
+
+    __slots__ = ("terms",)
+    num_components = None
+
+    def __init__(self, *terms):
+        num_missing = self.num_components - len(terms)
+        if num_missing < 0:
+            raise ValueError(
+                "Too many components", terms, self.num_components
+            )
+        self.terms = tuple(terms) + (0.0,) * num_missing
+
+    def _get_terms(self, other):
+        if type(other) is type(self):
+            return other.terms
+        elif isinstance(other, (float, int)):
+            return (float(other),) + (0.0,) * (self.num_components - 1)
+        else:
+            return None
+
+    def _from_terms(self, terms):
+        result = object.__new__(type(self))
+        result.terms = _renormalize(terms, self.num_components)
+        return result
+
+    def _add(self, terms1, terms2):
+        return self._from_terms(list(terms1 + terms2))
+
+    def _multiply(self, terms1, terms2):
+        # NOTE: Products with ``i + j >= num_components`` are dropped and
+        #       the error is only kept for ``i + j < num_components - 1``.
+        num_components = self.num_components
+        terms = []
+        for i in range(num_components):
+            for j in range(num_components - i):
+                if i + j == num_components - 1:
+                    terms.append(terms1[i] * terms2[j])
+                else:
+                    terms.extend(multiply_eft(terms1[i], terms2[j]))
+        return self._from_terms(terms)
+
+    def __add__(self, other):
+        terms = self._get_terms(other)
+        if terms is None:
+            return NotImplemented
+        return self._add(self.terms, terms)
+
+    def __radd__(self, other):
+        terms = self._get_terms(other)
+        if terms is None:
+            return NotImplemented
+        return self._add(terms, self.terms)
+
+    def __sub__(self, other):
+        terms = self._get_terms(other)
+        if terms is None:
+            return NotImplemented
+        return self._add(self.terms, tuple(-term for term in terms))
+
+    def __rsub__(self, other):
+        terms = self._get_terms(other)
+        if terms is None:
+            return NotImplemented
+        return self._add(terms, tuple(-term for term in self.terms))
+
+    def __neg__(self):
+        result = object.__new__(type(self))
+        result.terms = tuple(-term for term in self.terms)
+        return result
+
+    def __mul__(self, other):
+        terms = self._get_terms(other)
+        if terms is None:
+            return NotImplemented
+        return self._multiply(self.terms, terms)
+
+    def __rmul__(self, other):
+        terms = self._get_terms(other)
+        if terms is None:
+            return NotImplemented
+        return self._multiply(terms, self.terms)
+
+    def __float__(self):
+        # Sum from smallest to largest.
+        result = 0.0
+        for term in reversed(self.terms):
+            result += term
+        return result
+
+    def __repr__(self):
+        parts = ", ".join(repr(term) for term in self.terms)
+        return "{}({})".format(type(self).__name__, parts)
+
+
+class DoubleDouble(MultiFloat):
+    """A :class:`MultiFloat` with two components."""
+
+    __slots__ = ()
+    num_components = 2
+
+
+class TripleDouble(MultiFloat):
+    """A :class:`MultiFloat` with three components."""
+
+    __slots__ = ()
+    num_components = 3
@@ -93,20 +93,61 @@ def compensated3(x, coeffs):
     return eft.sum_k(p, 3)
 
 
-def compensated_k(x, coeffs, k):
-    h = {}
+def _compensated_k_terms(x, coeffs, k):
+    """Generate the terms summed in :func:`compensated_k`.
+
+    Each term is yielded as soon as it is computed (and the polynomials
+    that are no longer needed are discarded).
+    """
     p = {1: coeffs}
 
     # First, "filter" off the errors from the interior
     # polynomials.
     for i in range(1, 2 ** (k - 1)):
-        h[i], p[2 * i], p[2 * i + 1] = _compensated(x, p[i])
+        h_i, p[2 * i], p[2 * i + 1] = _compensated(x, p.pop(i))
+        yield h_i
 
     # Then use standard Horner for the leaf polynomials.
     for i in range(2 ** (k - 1), 2 ** k):
-        h[i] = basic(x, p[i])
+        yield basic(x, p.pop(i))
+
+
+def compensated_k(x, coeffs, k, faithful=False):
+    """K-compensated Horner's method.
 
-    # Now use K-fold summation on everything in ``h`` (but keep the
-    # order).
-    to_sum = [h[i] for i in range(1, 2 ** k)]
+    If ``faithful`` is :data:`True`, the terms are summed via
+    :func:`eft.acc_sum` instead of :func:`eft.sum_k`.
+    """
+    # Use K-fold summation on every term (but keep the order).
+    to_sum = list(_compensated_k_terms(x, coeffs, k))
+    if faithful:
+        return eft.acc_sum(to_sum)
     return eft.sum_k(to_sum, k)
+
+
+def accumulate(x, coeffs, accumulator, k=2):
+    """Add the terms of K-compensated Horner's method to an accumulator.
+
+    Rather than being summed (as in :func:`compensated_k`), each term is
+    added to ``accumulator`` (an :class:`eft.SumKAccumulator`) as soon as
+    it is computed, so no list of terms is built. For example, after
+    calling this at many points, ``accumulator.result(k)`` is the
+    ``k``-fold compensated sum of :math:`p` over those points.
+
+    Args:
+        x (float): The point to evaluate at.
+        coeffs (Sequence[float]): The coefficients (highest degree first).
+        accumulator (eft.SumKAccumulator): The accumulator to add the
+            terms to.
+        k (Optional[int]): The number of compensation levels. Defaults
+            to ``2``.
+
+    Raises:
+        ValueError: If ``accumulator.max_k`` is less than ``k``.
+    """
+    if accumulator.max_k < k:
+        raise ValueError(
+            "The accumulator does not support K", k, accumulator.max_k
+        )
+
+    accumulator.extend(_compensated_k_terms(x, coeffs, k))
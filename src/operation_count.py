@@ -13,7 +13,7 @@
 """Helpers for counting flops."""
 
 
-import fractions
+import eft
 
 
 _DISPLAY_TEMPLATE = (
@@ -146,8 +146,5 @@ class Float(object):
             raise TypeError("Only `Float` or `float` allowed in fma")
 
         self.computation.fma_count += 1
-        frac1 = fractions.Fraction(float1)
-        frac2 = fractions.Fraction(float2)
-        frac3 = fractions.Fraction(float3)
-        result = float(frac1 * frac2 + frac3)
+        result = eft._fma(float1, float2, float3)
         return Float(result, self.computation)
@@ -0,0 +1,394 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Finds the roots of a polynomial in Bernstein form.
+
+Only roots in :math:`\left[0, 1\right]` are found. Roots are first
+isolated by subdividing :math:`\left[0, 1\right]` and counting sign
+variations in the Bernstein coefficients on each piece.
+By Descartes' rule of signs (for the Bernstein basis), the number of
+roots in the open interval is at most the number of sign variations
+(and has the same parity). So an interval with no variations can be
+discarded and an interval with exactly one variation contains exactly
+one (simple) root.
+
+Each isolated root is then refined with a safeguarded Newton's method
+that uses compensated de Casteljau (via
+:func:`de_casteljau.compensated_with_derivative`) to evaluate
+:math:`p(s)` and :math:`p'(s)`.
+
+Near a multiple root (or a cluster of roots) the Bernstein coefficients
+on small intervals are dominated by round-off, which shows up as the
+number of sign variations *increasing* after subdivision (which is
+impossible in exact arithmetic). Such intervals are refined as a single
+root of multiplicity :math:`m` (the number of sign variations) with the
+modified Newton's method :math:`s - m p(s) / p'(s)`, and ``K`` is only
+increased (starting from ``K = 2``) when the a posteriori error bound
+from :func:`de_casteljau.compensated_with_bound` shows that the computed
+values are all noise.
+"""
+
+import de_casteljau
+
+
+_U = 0.5 ** 53
+_MAX_ITERATIONS = 100
+_MIN_WIDTH = 0.5 ** 20
+
+
+def _subdivide_half(coeffs):
+    """Subdivide a polynomial in Bernstein form at :math:`s = 1/2`.
+
+    Multiplication by ``0.5`` is exact, so the only round-off comes from
+    the additions.
+    """
+    degree = len(coeffs) - 1
+    pk = list(coeffs)
+    left = [pk[0]]
+    right = [pk[degree]]
+    for k in range(degree):
+        pk = [0.5 * pk[j] + 0.5 * pk[j + 1] for j in range(degree - k)]
+        left.append(pk[0])
+        right.append(pk[-1])
+
+    right.reverse()
+    return left, right
+
+
+def _sign_variations(coeffs):
+    """Count the sign variations in a sequence (ignoring zeros)."""
+    count = 0
+    prev_negative = None
+    for coeff in coeffs:
+        if coeff == 0.0:
+            continue
+        is_negative = coeff < 0.0
+        if prev_negative is not None and is_negative != prev_negative:
+            count += 1
+        prev_negative = is_negative
+
+    return count
+
+
+def _num_leading_zeros(coeffs):
+    count = 0
+    for coeff in coeffs:
+        if coeff != 0.0:
+            break
+        count += 1
+
+    return count
+
+
+def _first_sign(coeffs):
+    """The sign of :math:`p` just to the right of the left endpoint."""
+    for coeff in coeffs:
+        if coeff != 0.0:
+            return -1.0 if coeff < 0.0 else 1.0
+
+    return 0.0
+
+
+def _value_or_zero(coeffs, s):
+    """Evaluate :math:`p(s)` with compensated de Casteljau.
+
+    If the computed value is no larger than the (rigorous) bound on its
+    error, its sign can't be trusted and ``0.0`` is returned instead,
+    i.e. ``s`` is treated as a root.
+    """
+    value, bound = de_casteljau.compensated_with_bound(s, coeffs)
+    if abs(value) <= bound:
+        return 0.0
+    return value
+
+
+def _subdivide_intervals(coeffs, stack, min_width, result):
+    """Subdivide intervals until their roots are isolated.
+
+    Helper for :func:`_isolate` (and for re-isolating an interval in
+    :func:`find_roots`). Each entry of ``stack`` is an interval, its
+    Bernstein coefficients and their number of sign variations. Every
+    isolated interval (or exact root) is added to ``result``.
+    """
+    while stack:
+        a, b, local_coeffs, variations = stack.pop()
+        if variations == 0:
+            continue
+        if variations == 1 or b - a < min_width:
+            result.append((a, b, variations, local_coeffs))
+            continue
+
+        left, right = _subdivide_half(local_coeffs)
+        midpoint = 0.5 * (a + b)
+        # NOTE: In exact arithmetic ``left[-1] == right[0] == p(midpoint)``,
+        #       but the subdivided value has round-off (it may be ``0.0``
+        #       or even have the wrong sign). So it is replaced by the
+        #       compensated value and the midpoint is only a root when
+        #       that value is zero (or within its error bound).
+        mid_value = _value_or_zero(coeffs, midpoint)
+        left[-1] = mid_value
+        right[0] = mid_value
+        mid_roots = 0
+        if mid_value == 0.0:
+            mid_roots = max(
+                _num_leading_zeros(reversed(left)), _num_leading_zeros(right)
+            )
+        left_variations = _sign_variations(left)
+        right_variations = _sign_variations(right)
+        if left_variations + right_variations + mid_roots > variations:
+            # NOTE: In exact arithmetic, subdivision can't increase the
+            #       number of sign variations, so the coefficients must be
+            #       dominated by round-off.
+            result.append((a, b, variations, local_coeffs))
+            continue
+
+        if mid_roots:
+            result.append((midpoint, midpoint, mid_roots, None))
+        stack.append((midpoint, b, right, right_variations))
+        stack.append((a, midpoint, left, left_variations))
+
+
+def _isolate(coeffs, min_width):
+    """Isolate the roots in :math:`\\left[0, 1\\right]`.
+
+    This is the "work" done by :func:`isolate`, but the Bernstein
+    coefficients on each interval are also returned (as a fourth entry).
+    """
+    degree = len(coeffs) - 1
+    num_zero = _num_leading_zeros(coeffs)
+    if num_zero == degree + 1:
+        raise ValueError("The zero polynomial has infinitely many roots")
+
+    result = []
+    if num_zero:
+        result.append((0.0, 0.0, num_zero, None))
+    num_zero = _num_leading_zeros(reversed(coeffs))
+    if num_zero:
+        result.append((1.0, 1.0, num_zero, None))
+
+    stack = [(0.0, 1.0, list(coeffs), _sign_variations(coeffs))]
+    _subdivide_intervals(coeffs, stack, min_width, result)
+    result.sort(key=lambda info: info[:3])
+    return result
+
+
+def isolate(coeffs, min_width=_MIN_WIDTH):
+    """Isolate the roots in :math:`\\left[0, 1\\right]`.
+
+    Args:
+        coeffs (Sequence[float]): The Bernstein coefficients.
+        min_width (Optional[float]): The width below which an interval
+            with more than one sign variation will no longer be
+            subdivided. Defaults to :math:`2^{-20}`.
+
+    Returns:
+        List[Tuple[float, float, int]]: Triples ``(a, b, num_roots)``,
+        sorted by ``a``. When ``a == b``, the left endpoint is a root
+        with multiplicity ``num_roots``: either ``0`` or ``1`` with a
+        zero coefficient or a subdivision point where the compensated
+        value of :math:`p` is zero (or within its error bound).
+        Otherwise the interval contains a simple root
+        (``num_roots == 1``) or a cluster of at most ``num_roots``
+        roots.
+
+    Raises:
+        ValueError: If every coefficient is zero.
+    """
+    return [info[:3] for info in _isolate(coeffs, min_width)]
+
+
+def _is_converged(x, new_x):
+    return abs(new_x - x) <= 4.0 * _U * abs(new_x)
+
+
+def _brackets(coeffs, a, b, sign_a, sign_b):
+    """Check that :math:`p` changes sign on :math:`\\left[a, b\\right]`.
+
+    Here ``sign_a`` and ``sign_b`` are the signs of :math:`p` just inside
+    of the interval (e.g. from the local Bernstein coefficients). They
+    must differ and must agree with the (compensated) values of
+    :math:`p` at the endpoints, unless an endpoint is a root.
+    """
+    if sign_a == sign_b:
+        return False
+
+    for x, sign in ((a, sign_a), (b, sign_b)):
+        value = _value_or_zero(coeffs, x)
+        if value != 0.0 and (value < 0.0) != (sign < 0.0):
+            return False
+
+    return True
+
+
+def _reisolate(coeffs, a, b, local_coeffs, min_width):
+    """Isolate the roots on an interval again.
+
+    The endpoint coefficients are replaced by the compensated values of
+    :math:`p` (in exact arithmetic they are equal) before subdividing.
+    """
+    local_coeffs = list(local_coeffs)
+    local_coeffs[0] = _value_or_zero(coeffs, a)
+    local_coeffs[-1] = _value_or_zero(coeffs, b)
+    stack = [(a, b, local_coeffs, _sign_variations(local_coeffs))]
+    result = []
+    _subdivide_intervals(coeffs, stack, min_width, result)
+    return result
+
+
+def _refine_simple(coeffs, a, b, sign_a):
+    """Refine a simple root with a safeguarded Newton's method.
+
+    The interval :math:`\\left[a, b\\right]` must bracket the root
+    (``sign_a`` is the sign of :math:`p` just to the right of ``a``, see
+    :func:`_brackets`) and a bisection step is taken whenever a Newton
+    step would leave it. The iteration stops once a Newton step is too
+    small to change the iterate or once the sign changes between
+    neighbouring floats (i.e. the bracket can't be narrowed).
+    """
+    x = 0.5 * (a + b)
+    best_x = x
+    best_value = None
+    for _ in range(_MAX_ITERATIONS):
+        value, deriv = de_casteljau.compensated_with_derivative(x, coeffs)
+        if value == 0.0:
+            return x
+        if best_value is None or abs(value) < abs(best_value):
+            best_x = x
+            best_value = value
+
+        if (value < 0.0) == (sign_a < 0.0):
+            a = x
+        else:
+            b = x
+
+        new_x = 0.5 * (a + b)
+        if not a < new_x < b:
+            return best_x
+
+        if deriv != 0.0:
+            newton_x = x - value / deriv
+            if newton_x == x:
+                return x
+            if a < newton_x < b:
+                new_x = newton_x
+
+        x = new_x
+
+    return best_x
+
+
+def _modified_newton(coeffs, a, b, x, multiplicity, K):
+    """Perform the modified Newton's method for a root cluster.
+
+    Iterates stay in :math:`\\left[a, b\\right]`; if a step would leave
+    the interval, the iteration stops.
+    """
+    converged = False
+    for _ in range(_MAX_ITERATIONS):
+        value, deriv = de_casteljau.compensated_with_derivative(
+            x, coeffs, K=K
+        )
+        if value == 0.0 or deriv == 0.0:
+            return x
+
+        new_x = x - multiplicity * value / deriv
+        if not a <= new_x <= b:
+            return x
+        # NOTE: The test in ``_is_converged()`` passes (at least) one
+        #       step before the iterates stop changing, so one more step
+        #       is taken.
+        if converged:
+            return new_x
+        converged = _is_converged(x, new_x)
+        x = new_x
+
+    return x
+
+
+def _refine_cluster(coeffs, a, b, multiplicity, max_k):
+    """Refine a cluster of roots as a single multiple root.
+
+    This starts with ``K = 2`` and only adds a compensation level if,
+    at the refined root, the computed value is no larger than the
+    (rigorous) bound on its error, i.e. if the Newton iterates could
+    have been driven entirely by round-off.
+
+    Returns:
+        Tuple[float, int]: The refined root and the ``K`` used.
+    """
+    x = 0.5 * (a + b)
+    K = 2
+    while True:
+        x = _modified_newton(coeffs, a, b, x, multiplicity, K)
+        if K >= max_k:
+            return x, K
+
+        value, bound = de_casteljau.compensated_with_bound(x, coeffs, K=K)
+        if value == 0.0 or abs(value) > bound:
+            return x, K
+        K += 1
+
+
+def find_roots(coeffs, max_k=5, min_width=_MIN_WIDTH):
+    """Find the roots in :math:`\\left[0, 1\\right]`.
+
+    The work done is proportional to the number of roots (and the depth
+    of subdivision needed to separate them), rather than the size of a
+    grid of sample points.
+
+    .. note::
+
+       Roots closer together than ``min_width`` may be reported as a
+       single root with a higher multiplicity.
+
+    Args:
+        coeffs (Sequence[float]): The Bernstein coefficients.
+        max_k (Optional[int]): The largest ``K`` to use when refining a
+            cluster of roots. Defaults to ``5``.
+        min_width (Optional[float]): The width below which an interval
+            with more than one sign variation will no longer be
+            subdivided (see :func:`isolate`). Defaults to
+            :math:`2^{-20}`.
+
+    Returns:
+        List[Tuple[float, int]]: Pairs of roots and multiplicities,
+        sorted by root. For a cluster, the multiplicity is the number of
+        sign variations, which is an upper bound on the number of roots
+        in the cluster.
+    """
+    result = []
+    intervals = _isolate(coeffs, min_width)
+    while intervals:
+        a, b, num_roots, local_coeffs = intervals.pop()
+        if a == b:
+            result.append((a, num_roots))
+            continue
+
+        if num_roots == 1:
+            sign_a = _first_sign(local_coeffs)
+            sign_b = _first_sign(reversed(local_coeffs))
+            if not _brackets(coeffs, a, b, sign_a, sign_b):
+                # NOTE: The local coefficients have round-off, so the
+                #       interval is only trusted if ``p`` really changes
+                #       sign. Otherwise, it is isolated again using the
+                #       (compensated) values at the endpoints.
+                intervals.extend(
+                    _reisolate(coeffs, a, b, local_coeffs, min_width)
+                )
+                continue
+            root = _refine_simple(coeffs, a, b, sign_a)
+        else:
+            root, _ = _refine_cluster(coeffs, a, b, num_roots, max_k)
+        result.append((root, num_roots))
+
+    result.sort()
+    return result
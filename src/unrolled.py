@@ -0,0 +1,260 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Generates unrolled compensated de Casteljau kernels.
+
+:func:`de_casteljau._compensated_k` works for any degree and any ``K``,
+so it spends much of its time on loop and container overhead. This
+module generates (Python) source for a straight-line version for a
+fixed ``(degree, K)`` (similar to the ``compensated<K, degree>`` template
+in ``src/de_casteljau.hpp``), with every node of the triangle in a local
+variable and :func:`eft.add_eft` / :func:`eft.multiply_eft` inlined.
+
+The operations performed are exactly those in
+:func:`de_casteljau._compensated_k` so the results match it
+bit-for-bit. The only difference is that products are always
+transformed via Dekker's product (rather than an FMA) and the splits of
+:math:`s, \\widehat{r}, \\rho` and of each node in the triangle are only
+computed once. Since the error in a product is exactly representable,
+this gives the same value as an FMA.
+
+.. note::
+
+   As in :func:`eft.multiply_eft_array`, this assumes the inputs are
+   small enough that splitting doesn't overflow and that the error does
+   not underflow.
+"""
+
+import functools
+
+import eft
+
+
+_SPLITTER = "134217729.0"  # 134217729 == 2^{27} + 1.
+_CACHE_SIZE = 64
+
+
+class _Emitter(object):
+    """Accumulates the lines of a generated kernel.
+
+    Names of temporary values are unique within a kernel (though many
+    are only used while computing a single node).
+    """
+
+    def __init__(self):
+        self.lines = []
+        self.splits = {}
+        self._num_temps = 0
+
+    def emit(self, line):
+        self.lines.append("    " + line)
+
+    def temp(self, prefix="t"):
+        self._num_temps += 1
+        return "{}{}".format(prefix, self._num_temps)
+
+    def split(self, name):
+        """Split a value (only the first time it is needed)."""
+        if name not in self.splits:
+            scaled = self.temp()
+            high = name + "_hi"
+            low = name + "_lo"
+            self.emit("{} = {} * {}".format(scaled, name, _SPLITTER))
+            self.emit("{} = {} - ({} - {})".format(high, scaled, scaled, name))
+            self.emit("{} = {} - {}".format(low, name, high))
+            self.splits[name] = high, low
+
+        return self.splits[name]
+
+    def add_eft(self, val1, val2, sum_=None, error=None):
+        """Inlined version of :func:`eft.add_eft`."""
+        if sum_ is None:
+            sum_ = self.temp()
+        if error is None:
+            error = self.temp("e")
+        delta1 = self.temp("d")
+        self.emit("{} = {} + {}".format(sum_, val1, val2))
+        self.emit("{} = {} - {}".format(delta1, sum_, val1))
+        self.emit(
+            "{} = ({} - ({} - {})) + ({} - {})".format(
+                error, val1, sum_, delta1, val2, delta1
+            )
+        )
+        return sum_, error
+
+    def multiply_eft(self, val1, val2):
+        """Inlined version of :func:`eft.multiply_eft` (via Dekker)."""
+        high1, low1 = self.split(val1)
+        high2, low2 = self.split(val2)
+        product = self.temp("p")
+        error = self.temp("e")
+        self.emit("{} = {} * {}".format(product, val1, val2))
+        self.emit(
+            "{} = {} * {} - ((({} - {} * {}) - {} * {}) - {} * {})".format(
+                error,
+                low1,
+                low2,
+                product,
+                high1,
+                high2,
+                low1,
+                high2,
+                high1,
+                low2,
+            )
+        )
+        return product, error
+
+
+def _node_name(F, k, j):
+    return "b{}_{}_{}".format(F, k, j)
+
+
+def _emit_local_error_eft(emitter, errors, delta_b):
+    """Inlined version of :func:`de_casteljau.local_error_eft`."""
+    num_errs = len(errors)
+    new_errors = [None] * (num_errs + 1)
+
+    l_hat, new_errors[0] = emitter.add_eft(errors[0], errors[1])
+    for j in range(2, num_errs):
+        l_hat, new_errors[j - 1] = emitter.add_eft(l_hat, errors[j])
+
+    prod, new_errors[num_errs - 1] = emitter.multiply_eft("rho", delta_b)
+    l_hat, new_errors[num_errs] = emitter.add_eft(l_hat, prod)
+
+    return new_errors, l_hat
+
+
+def _emit_local_error(emitter, errors, delta_b):
+    """Inlined version of :func:`de_casteljau.local_error`."""
+    l_hat = emitter.temp("l")
+    emitter.emit("{} = {} + {}".format(l_hat, errors[0], errors[1]))
+    for error in errors[2:]:
+        emitter.emit("{} += {}".format(l_hat, error))
+    emitter.emit("{} += rho * {}".format(l_hat, delta_b))
+    return l_hat
+
+
+def kernel_source(degree, K, name="kernel"):
+    """Generate the source for an unrolled kernel.
+
+    Args:
+        degree (int): The degree of the polynomials to be evaluated.
+        K (int): The number of compensation levels (must be at least 2).
+        name (Optional[str]): The name of the generated function.
+
+    Returns:
+        str: The source of a function ``name(s, coeffs)`` that returns
+        the same ``K`` components as
+        :func:`de_casteljau._compensated_k`.
+
+    Raises:
+        ValueError: If ``K`` is less than 2.
+    """
+    if K < 2:
+        raise ValueError("K must be at least 2", K)
+
+    emitter = _Emitter()
+    emitter.lines.append("def {}(s, coeffs):".format(name))
+    names = [_node_name(0, 0, j) for j in range(degree + 1)]
+    emitter.emit("{}, = coeffs".format(", ".join(names)))
+    for F in range(1, K - 1 + 1):
+        for j in range(degree + 1):
+            emitter.emit("{} = 0.0".format(_node_name(F, 0, j)))
+
+    emitter.emit("neg_s = -s")
+    emitter.add_eft("1.0", "neg_s", sum_="r", error="rho")
+
+    for k in range(degree):
+        for j in range(degree - k):
+            # Update the "level 0" stuff.
+            P1, pi1 = emitter.multiply_eft("r", _node_name(0, k, j))
+            P2, pi2 = emitter.multiply_eft("s", _node_name(0, k, j + 1))
+            _, sigma3 = emitter.add_eft(P1, P2, sum_=_node_name(0, k + 1, j))
+
+            errors = [pi1, pi2, sigma3]
+            delta_b = _node_name(0, k, j)
+
+            for F in range(1, K - 2 + 1):
+                new_errors, l_hat = _emit_local_error_eft(
+                    emitter, errors, delta_b
+                )
+                P1, pi1 = emitter.multiply_eft("s", _node_name(F, k, j + 1))
+                S2, sigma2 = emitter.add_eft(l_hat, P1)
+                P3, pi3 = emitter.multiply_eft("r", _node_name(F, k, j))
+                _, sigma4 = emitter.add_eft(
+                    S2, P3, sum_=_node_name(F, k + 1, j)
+                )
+
+                new_errors.extend([pi1, sigma2, pi3, sigma4])
+                errors = new_errors
+                delta_b = _node_name(F, k, j)
+
+            # Update the "level 2" stuff.
+            l_hat = _emit_local_error(emitter, errors, delta_b)
+            emitter.emit(
+                "{} = {} + s * {} + r * {}".format(
+                    _node_name(K - 1, k + 1, j),
+                    l_hat,
+                    _node_name(K - 1, k, j + 1),
+                    _node_name(K - 1, k, j),
+                )
+            )
+
+    components = [_node_name(F, degree, 0) for F in range(K - 1 + 1)]
+    emitter.emit("return {},".format(", ".join(components)))
+
+    return "\n".join(emitter.lines) + "\n"
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def get_kernel(degree, K):
+    """Get an unrolled kernel for a given ``(degree, K)``.
+
+    Kernels are generated (via :func:`kernel_source`) and compiled on
+    first use and then cached (in a least recently used cache).
+
+    Args:
+        degree (int): The degree of the polynomials to be evaluated.
+        K (int): The number of compensation levels (must be at least 2).
+
+    Returns:
+        Callable[[float, Sequence[float]], Tuple[float, ...]]: A function
+        with the same signature (less ``K``) and return value as
+        :func:`de_casteljau._compensated_k`.
+    """
+    name = "compensated_k_degree{}_K{}".format(degree, K)
+    source = kernel_source(degree, K, name=name)
+    namespace = {}
+    code = compile(source, "<{}>".format(name), "exec")
+    exec(code, namespace)
+    return namespace[name]
+
+
+def compensated(s, coeffs, K=2):
+    """Compensated de Casteljau algorithm via an unrolled kernel.
+
+    Matches :func:`de_casteljau.compensated` (or
+    :func:`de_casteljau.compensated3`, etc. depending on ``K``)
+    bit-for-bit.
+
+    Args:
+        s (float): The point to evaluate at.
+        coeffs (Sequence[float]): The Bernstein coefficients.
+        K (Optional[int]): The number of compensation levels. Defaults
+            to ``2``.
+
+    Returns:
+        float: The evaluated value.
+    """
+    kernel = get_kernel(len(coeffs) - 1, K)
+    return eft.sum_k(kernel(s, coeffs), K)